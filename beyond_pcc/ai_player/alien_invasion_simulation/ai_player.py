@@ -0,0 +1,270 @@
+import sys
+
+import pygame
+
+from alien_invasion import AlienInvasion
+from planner import Planner
+
+class AIPlayer:
+
+    # Each strategy is named after the version of the game it comes from.
+    #   It maps to the method that implements it, how many times faster
+    #   than normal the game plays, and whether the player acts after the
+    #   game updates instead of before. sweeps_right_left plays at normal
+    #   speed and fires after each update, as that version did. From
+    #   modifies_speed on, the game plays five times faster, and the player
+    #   acts before each update.
+    strategies = {
+        'sweeps_right_left': ('_sweep_and_fire', 1, True),
+        'modifies_speed': ('_sweep_and_fire', 5, False),
+        'randomized_firing': ('_sweep_and_fire_randomly', 5, False),
+        'changing_strategies': ('_sweep_then_stop', 5, False),
+        'targets_alien': ('_target_and_fire', 5, False),
+        'plans_ahead': ('_plan_and_fire', 5, False),
+    }
+
+    def __init__(self, ai_game, strategy='targets_alien',
+            decision_interval=1):
+        """Automatic player for Alien Invasion.
+
+        The strategy is re-evaluated at most once every decision_interval
+          ticks, and the last action is repeated in between. A strategy
+          can return a longer interval when it knows its action won't need
+          to change for a while. A new fleet or a lost ship calls for a
+          new decision right away.
+        """
+
+        # Need a reference to the game object.
+        self.ai_game = ai_game
+
+        # Use the chosen strategy every time the player needs to act.
+        self.strategy = strategy
+        method_name, self.speed_factor, self.acts_after_update = (
+                self.strategies[strategy])
+        self._implement_strategy = getattr(self, method_name)
+
+        # Schedule for re-evaluating the strategy. A new fleet or a lost
+        #   ship always calls for a new decision.
+        self.decision_interval = decision_interval
+        self.next_decision_tick = 0
+        self.decision_state = None
+        self.fired = False
+        self.last_fired = False
+
+        # The planning strategy simulates moves ahead before acting.
+        self.planner = Planner(ai_game)
+
+    def run_game(self, max_ticks=None):
+        """Replaces the original run_game(), so we can interject our own
+        controls.
+
+        In a headless game, max_ticks optionally limits how long the game
+          can run.
+        """
+
+        # Start out in an active state, and hide the mouse.
+        self.ai_game.stats.game_active = True
+        if not self.ai_game.headless:
+            pygame.mouse.set_visible(False)
+
+        # Play at the strategy's speed. Later versions speed up the game for
+        #   development work. The replay starts from these speeds.
+        self._modify_speed(self.speed_factor)
+        self.ai_game._start_replay()
+
+        # Get the full fleet size.
+        self.fleet_size = len(self.ai_game.aliens)
+
+        if self.ai_game.headless:
+            self._run_headless(max_ticks)
+            return
+
+        # Start the main loop for the game.
+        while True:
+            # Still call ai_game._check_events(), so we can use keyboard to
+            #   quit. Also call our own method to initiate events.
+            self.ai_game._check_events()
+
+            for _ in range(self.ai_game._tick_clock()):
+                self._play_tick()
+
+            self.ai_game._update_screen()
+
+    def _run_headless(self, max_ticks=None):
+        """Play until the game ends, without reading SDL's events or drawing.
+
+        Each pass through this loop is one fixed time step, but there's no
+          clock, so a full game runs as fast as the CPU allows.
+        """
+        stats = self.ai_game.stats
+        while stats.game_active:
+            if max_ticks is not None and stats.ticks >= max_ticks:
+                break
+
+            self._play_tick()
+
+    def _play_tick(self):
+        """Act and advance the game one tick, in the strategy's order.
+
+        Keys pressed after an update are handled at the start of the next
+          tick, before anything moves. So a bullet fired after an update
+          leaves from wherever the update left the ship.
+        """
+        if not self.acts_after_update:
+            self._act()
+        if self.ai_game.stats.game_active:
+            self.ai_game._update_game()
+        if self.acts_after_update:
+            self._act()
+
+    def _act(self):
+        """Re-evaluate the strategy if it's due, or repeat the last action.
+
+        The player presses keys through the game's input source, and the
+          game handles them on its next tick. The arrow keys stay held
+          between decisions, so repeating the last action only means
+          firing again if the last decision was to fire.
+        """
+        stats = self.ai_game.stats
+        state = (stats.level, stats.ships_left)
+        if (stats.ticks < self.next_decision_tick
+                and state == self.decision_state):
+            if self.last_fired:
+                self._fire()
+            return
+
+        self.fired = False
+        interval = self._implement_strategy() or 1
+        self.last_fired = self.fired
+        self.next_decision_tick = stats.ticks + max(interval,
+                self.decision_interval)
+        self.decision_state = state
+
+    def _sweep_and_fire(self):
+        """Sweep right and left, firing whenever possible.
+
+        Nothing changes until the ship nears an edge, so the strategy
+          doesn't need to run again until then.
+        """
+        ticks_to_turn = self._sweep_right_left()
+        self._fire()
+        return ticks_to_turn
+
+    def _sweep_and_fire_randomly(self):
+        """Sweep right and left, firing half the time."""
+        self._sweep_right_left()
+
+        # Fire a bullet at the given frequency, whenever possible.
+        firing_frequency = 0.5
+        if self.ai_game.rng.random() < firing_frequency:
+            self._fire()
+
+    def _sweep_then_stop(self):
+        """Sweep until half the fleet is destroyed, then stop and fire."""
+        # Sweep right and left until half the fleet is destroyed, then stop.
+        if len(self.ai_game.aliens) >= 0.5 * self.fleet_size:
+            self._sweep_right_left()
+        else:
+            self._move(0)
+
+        # Fire a bullet at the given frequency, whenever possible.
+        firing_frequency = 0.5
+        if self.ai_game.rng.random() < firing_frequency:
+            self._fire()
+
+    def _target_and_fire(self):
+        """Chase the bottom-right alien, firing whenever possible."""
+        # Get specific alien to chase.
+        target_alien = self._get_target_alien()
+
+        # Move toward target alien.
+        ship = self.ai_game.ship
+        if ship.rect.x < target_alien.rect.x:
+            self._move(1)
+        elif ship.rect.x > target_alien.rect.x:
+            self._move(-1)
+
+        # Fire a bullet whenever possible.
+        firing_frequency = 1.0
+        if self.ai_game.rng.random() < firing_frequency:
+            self._fire()
+
+    def _plan_and_fire(self):
+        """Follow the move the planner expects to shoot down the most aliens.
+
+        The move is kept until the planner plans again.
+        """
+        move, fire = self.planner.plan()
+
+        self._move(move)
+        if fire:
+            self._fire()
+
+        return self.planner.segment_ticks
+
+    def _get_target_alien(self):
+        """Get a specific alien to target.
+
+        The fleet grid keeps the fleet's rows in order, so the right-most
+          alien in the bottom row can be found without checking every
+          alien in the fleet.
+        """
+        return self.ai_game.fleet_grid.get_bottom_right_alien()
+
+    def _sweep_right_left(self):
+        """Sweep the ship right and left continuously.
+
+        Returns the number of ticks the ship can keep moving the same way
+          before it needs to turn.
+        """
+        ship = self.ai_game.ship
+        screen_rect = self.ai_game.screen.get_rect()
+
+        moving_right = ship.moving_right
+        if not ship.moving_right and not ship.moving_left:
+            # Ship hasn't started moving yet; move to the right.
+            moving_right = True
+        elif (ship.moving_right
+                    and ship.rect.right > screen_rect.right - 10):
+            # Ship about to hit right edge; move left.
+            moving_right = False
+        elif ship.moving_left and ship.rect.left < 10:
+            moving_right = True
+        self._move(1 if moving_right else -1)
+
+        if moving_right:
+            distance = screen_rect.right - 10 - ship.rect.right
+        else:
+            distance = ship.rect.left - 10
+        settings = self.ai_game.settings
+        step = settings.ship_speed / settings.ticks_per_second
+
+        # Leave a tick to spare, because the ship's rect is rounded.
+        return max(1, int(distance // step) - 1)
+
+    def _move(self, move):
+        """Hold the arrow keys to move left (-1), stay still (0), or right."""
+        self.ai_game.input_source.post_movement(self.ai_game.ship, move < 0,
+                move > 0)
+
+    def _fire(self):
+        """Press the fire key."""
+        self.ai_game.input_source.post_fire()
+        self.fired = True
+
+    def _modify_speed(self, speed_factor):
+        self.ai_game.settings.ship_speed *= speed_factor
+        self.ai_game.settings.bullet_speed *= speed_factor
+        self.ai_game.settings.alien_speed *= speed_factor
+
+if __name__ == '__main__':
+    # Pass --headless to play a full game without opening a window.
+    #   Use batch_runner.py to play many headless games at once.
+    headless = '--headless' in sys.argv
+    ai_game = AlienInvasion(headless=headless)
+
+    ai_player = AIPlayer(ai_game)
+    ai_player.run_game()
+
+    if headless:
+        print(f"Score: {ai_game.stats.score:,}, level: {ai_game.stats.level}")
\ No newline at end of file
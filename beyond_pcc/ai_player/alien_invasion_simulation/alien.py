@@ -0,0 +1,29 @@
+from pygame.sprite import Sprite
+
+from image_cache import image_cache
+ 
+class Alien(Sprite):
+    """A class to represent a single alien in the fleet."""
+
+    def __init__(self, ai_game):
+        """Initialize the alien and set its starting position."""
+        super().__init__()
+        self.screen = ai_game.screen
+        self.settings = ai_game.settings
+
+        # Load the alien image and set its rect attribute. Every alien
+        #   shares the same image. The image's background is the same color
+        #   as the screen, so it doesn't need to be drawn.
+        self.image = image_cache.load('images/alien.bmp',
+                colorkey=self.settings.bg_color)
+        self.rect = self.image.get_rect()
+
+        # Start each new alien near the top left of the screen.
+        self.rect.x = self.rect.width
+        self.rect.y = self.rect.height
+
+    def check_edges(self):
+        """Return True if alien is at edge of screen."""
+        screen_rect = self.screen.get_rect()
+        if self.rect.right >= screen_rect.right or self.rect.left <= 0:
+            return True
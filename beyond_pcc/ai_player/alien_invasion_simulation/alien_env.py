@@ -0,0 +1,156 @@
+"""Gym-style environments for training policies to play Alien Invasion.
+
+AlienInvasionEnv wraps a single headless game in the usual reset() and
+  step(action) interface. VectorAlienInvasionEnv steps several games in
+  lockstep in one process, so a policy can act on a whole batch of
+  observations at once.
+
+Observations are flat NumPy arrays. The first two values are the ship's
+  horizontal position as a fraction of the screen width, and the fleet's
+  direction. These are followed by two maps of the screen, divided into
+  alien-sized cells: the number of aliens in each cell, and then the
+  number of bullets in each cell. The reward for each step is the number
+  of points scored during that step.
+"""
+
+import numpy as np
+
+from alien_invasion import AlienInvasion
+
+
+# Each action is a (move, fire) pair. move is -1 to move left, 0 to stay
+#   still, and 1 to move right.
+ACTIONS = [(move, fire) for fire in (False, True) for move in (0, -1, 1)]
+
+
+class AlienInvasionEnv:
+    """A single headless game, driven one step at a time."""
+
+    def __init__(self, seed=None, max_ticks=None):
+        """Create the game.
+
+        If max_ticks is given, an episode ends after that many steps even
+          if the game isn't over.
+        """
+        self.ai_game = AlienInvasion(headless=True, seed=seed)
+        self.max_ticks = max_ticks
+
+        # Divide the screen into alien-sized cells for the observation maps.
+        settings = self.ai_game.settings
+        self.cell_width = self.ai_game.fleet_grid.cell_width
+        self.cell_height = self.ai_game.fleet_grid.cell_height
+        self.cols = -(-settings.screen_width // self.cell_width)
+        self.rows = -(-settings.screen_height // self.cell_height)
+
+        self.action_count = len(ACTIONS)
+        self.observation_size = 2 + 2 * self.rows * self.cols
+
+    def reset(self, seed=None):
+        """Start a new game, and return the first observation.
+
+        Passing a seed reseeds the game's random number generator.
+        """
+        if seed is not None:
+            self.ai_game.seed = seed
+            self.ai_game.rng.seed(seed)
+
+        self.ai_game._start_game()
+        return self._get_observation()
+
+    def step(self, action):
+        """Play one tick with the given action.
+
+        Returns (observation, reward, done, info), where info holds the
+          score, level, and ticks played so far.
+        """
+        # Press the keys for the action, to be handled on this tick.
+        move, fire = ACTIONS[action]
+        input_source = self.ai_game.input_source
+        input_source.post_movement(self.ai_game.ship, move < 0, move > 0)
+        if fire:
+            input_source.post_fire()
+
+        stats = self.ai_game.stats
+        old_score = stats.score
+        self.ai_game._update_game()
+        reward = stats.score - old_score
+
+        done = not stats.game_active
+        if self.max_ticks is not None and stats.ticks >= self.max_ticks:
+            done = True
+
+        info = {'score': stats.score, 'level': stats.level,
+                'ticks': stats.ticks}
+        return self._get_observation(), reward, done, info
+
+    def _get_observation(self):
+        """Return the current state of the game as a flat array."""
+        settings = self.ai_game.settings
+        ship_x = self.ai_game.ship.rect.centerx / settings.screen_width
+        header = np.array([ship_x, settings.fleet_direction],
+                dtype=np.float32)
+
+        alien_map = self._get_map(self.ai_game.aliens.sprites())
+        bullet_map = self._get_map(self.ai_game.bullets.sprites())
+        return np.concatenate([header, alien_map, bullet_map])
+
+    def _get_map(self, sprites):
+        """Count the sprites whose centers are in each cell of the screen."""
+        counts = np.zeros(self.rows * self.cols, dtype=np.float32)
+        if not sprites:
+            return counts
+
+        centers = np.array([sprite.rect.center for sprite in sprites])
+        cols = np.clip(centers[:, 0] // self.cell_width, 0, self.cols - 1)
+        rows = np.clip(centers[:, 1] // self.cell_height, 0, self.rows - 1)
+        np.add.at(counts, rows * self.cols + cols, 1)
+        return counts
+
+
+class VectorAlienInvasionEnv:
+    """Several independent games, stepped in lockstep in one process.
+
+    A game that ends is reset right away, so every step returns an
+      observation for every game. The last observation of a finished game
+      is passed back in that game's info, under 'final_observation'.
+    """
+
+    def __init__(self, num_envs, seed=0, max_ticks=None):
+        """Create num_envs games, seeded seed, seed + 1, and so on."""
+        self.envs = [AlienInvasionEnv(seed + index, max_ticks)
+                for index in range(num_envs)]
+        self.num_envs = num_envs
+        self.action_count = self.envs[0].action_count
+        self.observation_size = self.envs[0].observation_size
+
+    def reset(self):
+        """Start a new game in every environment.
+
+        Returns an array with one row of observations for each game.
+        """
+        return np.stack([env.reset() for env in self.envs])
+
+    def step(self, actions):
+        """Play one tick in every game, with one action for each game.
+
+        Returns arrays of observations, rewards, and done flags, and a
+          list of info dictionaries.
+        """
+        observations = np.empty((self.num_envs, self.observation_size),
+                dtype=np.float32)
+        rewards = np.empty(self.num_envs, dtype=np.float64)
+        dones = np.empty(self.num_envs, dtype=bool)
+        infos = []
+
+        for index, (env, action) in enumerate(zip(self.envs, actions)):
+            observation, reward, done, info = env.step(int(action))
+            if done:
+                info['final_observation'] = observation
+                observation = env.reset()
+
+            observations[index] = observation
+            rewards[index] = reward
+            dones[index] = done
+            infos.append(info)
+
+        return observations, rewards, dones, infos
@@ -0,0 +1,526 @@
+import os
+import random
+import sys
+
+import pygame
+
+from settings import Settings
+from game_stats import GameStats
+from scoreboard import Scoreboard
+from button import Button
+from ship import Ship
+from bullet_pool import BulletPool
+from alien import Alien
+from fleet_grid import FleetGrid
+from fleet_renderer import FleetRenderer
+from replay import Replay, get_game_settings
+from snapshot import take_snapshot, restore_snapshot
+from frame_profiler import FrameProfiler
+from image_cache import image_cache
+from input_source import InputSource
+from sound_effects import SoundEffects, SilentSoundEffects
+
+
+class AlienInvasion:
+    """Overall class to manage game assets and behavior."""
+
+    def __init__(self, headless=False, seed=None, settings=None):
+        """Initialize the game, and create game resources.
+
+        In headless mode the game uses SDL's dummy video driver, and never
+          draws to the screen, plays sounds, or handles mouse input. This
+          lets an AI player step the game as fast as the CPU allows.
+
+        Anything that needs random numbers during a game, such as an AI
+          player, should use self.rng. Passing the same seed gives the same
+          random numbers; if no seed is given, one is picked at random.
+
+        To play with settings other than the defaults, such as a larger
+          screen, pass in a Settings object.
+        """
+        self.headless = headless
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        if self.headless:
+            # A headless game's screen is never shown, and it never plays
+            #   a sound.
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            self.sound_effects = SilentSoundEffects()
+        else:
+            self.sound_effects = SoundEffects()
+
+        # Only start the parts of pygame every game uses. The mixer is left
+        #   for the sound effects to start when the first sound is played.
+        pygame.display.init()
+        pygame.font.init()
+        self.settings = settings or Settings()
+
+        self.screen = pygame.display.set_mode(
+            (self.settings.screen_width, self.settings.screen_height))
+        pygame.display.set_caption("Alien Invasion")
+
+        # Now that the display exists, convert any images that were loaded
+        #   before it to the display's pixel format.
+        image_cache.convert_all()
+
+        # Create an instance to store game statistics,
+        #   and create a scoreboard.
+        self.stats = GameStats(self)
+        self.sb = Scoreboard(self)
+
+        self.ship = Ship(self)
+        self.bullets = pygame.sprite.Group()
+        self.bullet_pool = BulletPool(self)
+        if self.settings.array_fleet:
+            # Only import NumPy if it's going to be used.
+            from array_fleet import ArrayFleet
+            self.aliens = ArrayFleet(self)
+        else:
+            self.aliens = pygame.sprite.Group()
+
+        self._make_fleet_aliens()
+        self._create_fleet()
+        self.fleet_renderer = FleetRenderer(self)
+
+        # The clock paces the main loop. lag holds time that has passed,
+        #   but hasn't been simulated yet.
+        self.clock = pygame.time.Clock()
+        self.lag = 0.0
+
+        # Ticks left in the pause after the ship is hit. The screen keeps
+        #   updating during the pause, but the game doesn't advance.
+        self.respawn_ticks = 0
+
+        # Rects of everything drawn in the last frame, for dirty-rect
+        #   rendering. None means the whole screen needs to be drawn.
+        self.drawn_rects = None
+
+        # Record the inputs on every tick, so the game can be replayed.
+        self._start_replay()
+
+        # Make the Play button.
+        self.play_button = Button(self, "Play")
+
+        # A headless game has no keyboard or mouse, so it only handles
+        #   events that are injected into its input source. Injected
+        #   events are handled on each tick, by _update_game().
+        self.input_source = InputSource(read_queue=not self.headless)
+
+        # The method that handles each (event type, key) pair. Events
+        #   without a key, such as mouse clicks, use None for the key.
+        self.event_handlers = {
+            (pygame.QUIT, None): self._quit,
+            (pygame.KEYDOWN, pygame.K_q): self._quit,
+            (pygame.KEYDOWN, pygame.K_RIGHT): self._start_moving_right,
+            (pygame.KEYUP, pygame.K_RIGHT): self._stop_moving_right,
+            (pygame.KEYDOWN, pygame.K_LEFT): self._start_moving_left,
+            (pygame.KEYUP, pygame.K_LEFT): self._stop_moving_left,
+            (pygame.KEYDOWN, pygame.K_SPACE): self._fire_bullet_on_key,
+            (pygame.MOUSEBUTTONDOWN, None): self._check_play_button_click,
+        }
+
+        # Time each phase of every frame, if profiling is turned on.
+        self.profiler = None
+        if self.settings.profile_frames:
+            self.profiler = FrameProfiler(self)
+
+    def run_game(self):
+        """Start the main loop for the game."""
+        while True:
+            self._check_events()
+
+            for _ in range(self._tick_clock()):
+                if self.stats.game_active:
+                    self._update_game()
+
+            self._update_screen()
+
+    def snapshot(self):
+        """Return the full state of the game as bytes.
+
+        This is fast enough to call on every tick. Pass the bytes to
+          restore() to go back to this point in the game.
+        """
+        return take_snapshot(self)
+
+    def restore(self, snapshot):
+        """Go back to the state saved by snapshot()."""
+        restore_snapshot(self, snapshot)
+
+    def _tick_clock(self):
+        """Wait for the next frame, and return how many steps are due.
+
+        The clock sleeps between frames, so the game only uses as much CPU
+          as the frame rate needs.
+        """
+        frame_time = self.clock.tick(self.settings.frames_per_second) / 1000
+        self.lag += min(frame_time, self.settings.max_frame_time)
+
+        time_step = 1 / self.settings.ticks_per_second
+        steps = int(self.lag // time_step)
+        self.lag -= steps * time_step
+        return steps
+
+    def _start_replay(self, snapshot=None):
+        """Start recording a new replay from the current speeds.
+
+        If the game was just restored from snapshot, the replay starts
+          from there.
+        """
+        speeds = (self.settings.ship_speed, self.settings.bullet_speed,
+                self.settings.alien_speed)
+        self.replay = Replay(self.seed, speeds,
+                get_game_settings(self.settings), snapshot=snapshot)
+        self.fired = False
+
+    def _update_game(self):
+        """Advance the ship, bullets, and fleet by one fixed time step."""
+        # Handle the inputs posted for this tick, such as an AI player's
+        #   moves. A shot fired during the pause is ignored.
+        self._handle_events(self.input_source.get_injected())
+
+        if self.respawn_ticks:
+            # Wait for the pause after the ship was hit to end.
+            self.respawn_ticks -= 1
+            return
+
+        self.replay.record(self.ship, self.fired)
+        self.fired = False
+
+        dt = 1 / self.settings.ticks_per_second
+        self.ship.update(dt)
+        self._update_bullets(dt)
+        self._update_aliens(dt)
+        self.stats.ticks += 1
+
+    def _check_events(self):
+        """Respond to keypresses and mouse events."""
+        self._handle_events(self.input_source.get_events())
+
+    def _handle_events(self, events):
+        """Pass each event to its handler, if it has one."""
+        for event in events:
+            handler = self.event_handlers.get(
+                    (event.type, getattr(event, 'key', None)))
+            if handler:
+                handler(event)
+
+    def _check_play_button_click(self, event):
+        """Check whether a mouse click was on the Play button."""
+        self._check_play_button(event.pos)
+
+    def _check_play_button(self, mouse_pos):
+        """Start a new game when the player clicks Play."""
+        button_clicked = self.play_button.rect.collidepoint(mouse_pos)
+        if button_clicked and not self.stats.game_active:
+            self._start_game()
+
+            # Hide the mouse cursor.
+            pygame.mouse.set_visible(False)
+
+    def _start_game(self):
+        """Reset everything, and start a new game."""
+        # Reset the game settings, and start a new replay.
+        self.settings.initialize_dynamic_settings()
+        self._start_replay()
+
+        # Reset the game statistics, and skip any pause left over from the
+        #   last game.
+        self.respawn_ticks = 0
+        self.stats.reset_stats()
+        self.stats.game_active = True
+        self.sb.prep_score()
+        self.sb.prep_level()
+        self.sb.prep_ships()
+
+        # Get rid of any remaining aliens and bullets.
+        self.aliens.empty()
+        self.bullet_pool.recycle_all(self.bullets)
+        
+        # Create a new fleet and center the ship.
+        self._create_fleet()
+        self.ship.center_ship()
+
+    def _quit(self, event):
+        """Quit the game."""
+        sys.exit()
+
+    def _start_moving_right(self, event):
+        """Start moving the ship right."""
+        self.ship.moving_right = True
+
+    def _stop_moving_right(self, event):
+        """Stop moving the ship right."""
+        self.ship.moving_right = False
+
+    def _start_moving_left(self, event):
+        """Start moving the ship left."""
+        self.ship.moving_left = True
+
+    def _stop_moving_left(self, event):
+        """Stop moving the ship left."""
+        self.ship.moving_left = False
+
+    def _fire_bullet_on_key(self, event):
+        """Fire a bullet when the fire key is pressed."""
+        self._fire_bullet()
+
+    def _fire_bullet(self):
+        """Create a new bullet and add it to the bullets group."""
+        if self.respawn_ticks:
+            # The new ship can't fire until the pause is over.
+            return
+        self.fired = True
+        if len(self.bullets) < self.settings.bullets_allowed:
+            new_bullet = self.bullet_pool.get_bullet()
+            self.bullets.add(new_bullet)
+            self.sound_effects.play('bullet')
+
+    def _update_bullets(self, dt):
+        """Update position of bullets and get rid of old bullets."""
+        # Update bullet positions. Bullets that have disappeared return
+        #   themselves to the bullet pool.
+        self.bullets.update(dt)
+
+        self._check_bullet_alien_collisions()
+
+    def _check_bullet_alien_collisions(self):
+        """Respond to bullet-alien collisions."""
+        # Remove any bullets and aliens that have collided.
+        collisions = self._find_bullet_alien_collisions()
+
+        if collisions:
+            for aliens in collisions.values():
+                self.stats.score += self.settings.alien_points * len(aliens)
+            self.sb.prep_score()
+            self.sb.check_high_score()
+            self.sound_effects.play('alien')
+
+        if not self.aliens:
+            # Destroy existing bullets and create new fleet.
+            self.bullet_pool.recycle_all(self.bullets)
+            self._create_fleet()
+            self.settings.increase_speed()
+
+            # Increase level.
+            self.stats.level += 1
+            self.sb.prep_level()
+
+    def _find_bullet_alien_collisions(self):
+        """Remove bullets and aliens that have collided.
+
+        This works like pygame.sprite.groupcollide(), but only checks each
+          bullet against the aliens near it in the fleet grid. Returns a
+          dictionary mapping each bullet that hit something to the list of
+          aliens it hit.
+        """
+        collisions = {}
+        for bullet in self.bullets.sprites():
+            aliens = self.fleet_grid.collide(bullet.rect)
+            if aliens:
+                collisions[bullet] = aliens
+                self.bullet_pool.recycle(bullet)
+                for alien in aliens:
+                    self.fleet_grid.remove(alien)
+                    alien.kill()
+        return collisions
+
+    def _update_aliens(self, dt):
+        """
+        Check if the fleet is at an edge,
+          then update the positions of all aliens in the fleet.
+        """
+        self._check_fleet_edges()
+
+        # The grid keeps the fleet's position, and every alien moves with
+        #   it, so the fleet keeps its formation.
+        distance = (self.settings.alien_speed * dt
+                * self.settings.fleet_direction)
+        if self.settings.array_fleet:
+            self.aliens.move(distance)
+        else:
+            self.fleet_grid.move(distance)
+
+        # Look for alien-ship collisions.
+        if self.fleet_grid.collide_any(self.ship.rect):
+            self._ship_hit()
+
+        # Look for aliens hitting the bottom of the screen.
+        self._check_aliens_bottom()
+
+    def _check_aliens_bottom(self):
+        """Check if any aliens have reached the bottom of the screen."""
+        if self.settings.array_fleet:
+            if self.aliens.check_bottom():
+                # Treat this the same as if the ship got hit.
+                self._ship_hit()
+            return
+
+        screen_rect = self.screen.get_rect()
+        for alien in self.aliens.sprites():
+            if alien.rect.bottom >= screen_rect.bottom:
+                # Treat this the same as if the ship got hit.
+                self._ship_hit()
+                break
+
+    def _ship_hit(self):
+        """Respond to the ship being hit by an alien."""
+        if self.stats.ships_left > 0:
+            # Decrement ships_left, and update scoreboard.
+            self.stats.ships_left -= 1
+            self.sb.prep_ships()
+            
+            # Get rid of any remaining aliens and bullets.
+            self.aliens.empty()
+            self.bullet_pool.recycle_all(self.bullets)
+            
+            # Create a new fleet and center the ship.
+            self._create_fleet()
+            self.ship.center_ship()
+            
+            # Pause, unless no one is watching.
+            if not self.headless:
+                self.respawn_ticks = round(self.settings.ship_hit_pause
+                        * self.settings.ticks_per_second)
+        else:
+            self.stats.game_active = False
+            if not self.headless:
+                pygame.mouse.set_visible(True)
+
+    def _create_fleet(self):
+        """Create the fleet of aliens.
+
+        Every fleet has the same layout, so the same aliens are moved back
+          to their starting positions and used again.
+        """
+        # Start a fresh grid for finding collisions with the new fleet.
+        self.fleet_grid = FleetGrid(*self.alien_size)
+
+        for alien, (x, y) in zip(self.fleet_aliens, self.fleet_layout):
+            alien.rect.topleft = (x, y)
+            self.fleet_grid.add(alien)
+        self.aliens.add(self.fleet_aliens)
+
+    def _make_fleet_aliens(self):
+        """Work out the fleet's layout, and make an alien for each position."""
+        # Create an alien and find the number of aliens in a row.
+        # Spacing between each alien is equal to one alien width.
+        alien = Alien(self)
+        alien_width, alien_height = alien.rect.size
+        available_space_x = self.settings.screen_width - (2 * alien_width)
+        number_aliens_x = available_space_x // (2 * alien_width)
+        
+        # Determine the number of rows of aliens that fit on the screen.
+        ship_height = self.ship.rect.height
+        available_space_y = (self.settings.screen_height -
+                                (3 * alien_height) - ship_height)
+        number_rows = available_space_y // (2 * alien_height)
+
+        # Find the starting position of each alien, row by row.
+        self.alien_size = (alien_width, alien_height)
+        self.fleet_layout = [
+                (alien_width + 2 * alien_width * alien_number,
+                    alien_height + 2 * alien_height * row_number)
+                for row_number in range(number_rows)
+                for alien_number in range(number_aliens_x)]
+
+        # Use the measuring alien as the first alien in the fleet.
+        self.fleet_aliens = [alien] + [Alien(self)
+                for _ in range(len(self.fleet_layout) - 1)]
+
+    def _check_fleet_edges(self):
+        """Respond appropriately if any aliens have reached an edge."""
+        if self.settings.array_fleet:
+            if self.aliens.check_edges():
+                self._change_fleet_direction()
+            return
+
+        for alien in self.aliens.sprites():
+            if alien.check_edges():
+                self._change_fleet_direction()
+                break
+            
+    def _change_fleet_direction(self):
+        """Drop the entire fleet and change the fleet's direction."""
+        if self.settings.array_fleet:
+            self.aliens.drop(self.settings.fleet_drop_speed)
+        else:
+            self.fleet_grid.drop(self.settings.fleet_drop_speed)
+        self.settings.fleet_direction *= -1
+
+    def _update_screen(self):
+        """Update images on the screen, and flip to the new screen."""
+        if self.headless:
+            # Nothing is ever drawn in a headless game.
+            return
+
+        if self.settings.dirty_rect_rendering and self.drawn_rects:
+            self._update_dirty_rects()
+            return
+
+        self.screen.fill(self.settings.bg_color)
+        self._draw_game()
+        pygame.display.flip()
+
+        if self.settings.dirty_rect_rendering:
+            self.drawn_rects = self._get_drawn_rects()
+
+    def _update_dirty_rects(self):
+        """Redraw and update only the parts of the screen that changed.
+
+        Everything drawn in the last frame is erased, then everything is
+          drawn in its new position. Only the old and new rects are sent to
+          the display, instead of the whole screen.
+        """
+        for rect in self.drawn_rects:
+            self.screen.fill(self.settings.bg_color, rect)
+        self._draw_game()
+
+        new_rects = self._get_drawn_rects()
+        pygame.display.update(self.drawn_rects + new_rects)
+        self.drawn_rects = new_rects
+
+    def _get_drawn_rects(self):
+        """Return copies of the rects of everything on the screen."""
+        rects = [self.ship.rect.copy()]
+        rects += [bullet.rect.copy() for bullet in self.bullets.sprites()]
+        if self.settings.fleet_surface_rendering:
+            fleet_rect = self.fleet_renderer.get_rect()
+            if fleet_rect:
+                rects.append(fleet_rect)
+        else:
+            rects += [alien.rect.copy() for alien in self.aliens.sprites()]
+        rects += self.sb.get_rects()
+        if not self.stats.game_active:
+            rects.append(self.play_button.rect.copy())
+        return rects
+
+    def _draw_fleet(self):
+        """Draw the fleet, all at once or one alien at a time."""
+        if self.settings.fleet_surface_rendering:
+            self.fleet_renderer.draw(self.screen)
+        else:
+            self.aliens.draw(self.screen)
+
+    def _draw_game(self):
+        """Draw the ship, bullets, fleet, scoreboard, and Play button."""
+        self.ship.blitme()
+        for bullet in self.bullets.sprites():
+            bullet.draw_bullet()
+        self._draw_fleet()
+
+        # Draw the score information.
+        self.sb.show_score()
+
+        # Draw the play button if the game is inactive.
+        if not self.stats.game_active:
+            self.play_button.draw_button()
+
+
+if __name__ == '__main__':
+    # Make a game instance, and run the game.
+    ai = AlienInvasion()
+    ai.run_game()
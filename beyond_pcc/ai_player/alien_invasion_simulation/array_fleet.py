@@ -0,0 +1,123 @@
+import numpy as np
+from pygame.sprite import Group
+
+
+class ArrayFleet(Group):
+    """A group of aliens whose positions are kept in NumPy arrays.
+
+    The fleet still holds ordinary Alien sprites, so it can be drawn,
+      counted, and searched like any other group. But moving the fleet,
+      dropping it, and checking it against the edges and bottom of the
+      screen are each done as one operation on the whole fleet, instead
+      of one alien at a time.
+
+    The fleet grid keeps the fleet's position, so the whole fleet stays in
+      formation. Each alien's position is its home position plus the
+      grid's offset. The positions are worked out as arrays, and written
+      back to the aliens' rects in one pass.
+    """
+
+    def __init__(self, ai_game):
+        """Initialize an empty fleet."""
+        super().__init__()
+        self.ai_game = ai_game
+        self.screen_rect = ai_game.screen.get_rect()
+
+        # The aliens in the position arrays, in order, with the index of
+        #   each one. Aliens that are shot down stay in the arrays until
+        #   the next time aliens are added.
+        self.alien_list = []
+        self.indexes = {}
+
+        # Home lefts and tops, rect lefts and tops, and which aliens are
+        #   still in the fleet.
+        self.home_x = np.zeros(0, dtype=int)
+        self.home_y = np.zeros(0, dtype=int)
+        self.x = np.zeros(0, dtype=int)
+        self.y = np.zeros(0, dtype=int)
+        self.in_fleet = np.zeros(0, dtype=bool)
+        self.arrays_current = True
+
+        # All aliens share the same image, so they're all the same size.
+        self.alien_width, self.alien_height = 0, 0
+
+    def add_internal(self, sprite, layer=None):
+        """Add an alien to the fleet, and to the position arrays."""
+        super().add_internal(sprite, layer)
+        self.alien_width, self.alien_height = sprite.rect.size
+        self.arrays_current = False
+
+    def remove_internal(self, sprite):
+        """Remove an alien from the fleet."""
+        super().remove_internal(sprite)
+        if self.arrays_current:
+            self.in_fleet[self.indexes[sprite]] = False
+
+    def empty(self):
+        """Remove all aliens, and clear the position arrays."""
+        super().empty()
+        self.alien_list = []
+        self.indexes = {}
+        self.arrays_current = False
+
+    def move(self, distance):
+        """Move the whole fleet right by distance, or left if it's negative."""
+        self._build_arrays()
+        if self.ai_game.fleet_grid.shift(distance):
+            self._place_aliens()
+
+    def drop(self, distance):
+        """Move the whole fleet down by distance."""
+        self._build_arrays()
+        self.ai_game.fleet_grid.shift(0.0, distance)
+        self._place_aliens()
+
+    def check_edges(self):
+        """Return True if any alien is at an edge of the screen."""
+        self._build_arrays()
+        lefts = self.x[self.in_fleet]
+        if not lefts.size:
+            return False
+
+        return bool(lefts.max() + self.alien_width >= self.screen_rect.right
+                or lefts.min() <= 0)
+
+    def check_bottom(self):
+        """Return True if any alien has reached the bottom of the screen."""
+        self._build_arrays()
+        tops = self.y[self.in_fleet]
+        if not tops.size:
+            return False
+
+        return bool(tops.max() + self.alien_height >= self.screen_rect.bottom)
+
+    def _place_aliens(self):
+        """Put every alien's rect at its home plus the grid's offset."""
+        offset_x, offset_y = self.ai_game.fleet_grid.get_offset()
+        self.x = self.home_x + offset_x
+        self.y = self.home_y + offset_y
+
+        for alien, x, y in zip(self.alien_list, self.x.tolist(),
+                self.y.tolist()):
+            alien.rect.topleft = (x, y)
+
+    def _build_arrays(self):
+        """Rebuild the position arrays if aliens have been added.
+
+        Aliens must be in the game's fleet grid before they're added here.
+        """
+        if self.arrays_current:
+            return
+
+        self.alien_list = self.sprites()
+        self.indexes = {alien: index
+                for index, alien in enumerate(self.alien_list)}
+
+        homes = self.ai_game.fleet_grid.homes
+        self.home_x = np.array([homes[alien][0] for alien in self.alien_list],
+                dtype=int)
+        self.home_y = np.array([homes[alien][1] for alien in self.alien_list],
+                dtype=int)
+        self.in_fleet = np.ones(len(self.alien_list), dtype=bool)
+        self.arrays_current = True
+        self._place_aliens()
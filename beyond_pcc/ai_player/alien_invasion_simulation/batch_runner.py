@@ -0,0 +1,132 @@
+"""Play many headless games with each AI strategy, and save the results.
+
+Each game gets its own seed, so any single game can be played again.
+  Games are spread across a pool of worker processes, one per core by
+  default. Results are written to a CSV or JSON file, depending on the
+  extension of the output filename. Replays of every game can be saved
+  as well, and played back with replay.py.
+
+Example:
+    python batch_runner.py --games 1000 --output results.csv
+"""
+
+import argparse
+import csv
+import json
+from multiprocessing import Pool
+from pathlib import Path
+from statistics import mean
+from time import perf_counter
+
+from alien_invasion import AlienInvasion
+from ai_player import AIPlayer
+
+
+# The order of the fields in each result.
+RESULT_FIELDS = ['strategy', 'seed', 'score', 'level', 'ticks', 'seconds']
+
+
+def play_game(job):
+    """Play one headless game, and return its result.
+
+    job is a (strategy, seed, max_ticks, decision_interval, replay_dir)
+      tuple, so it can be sent to a worker process as a single argument.
+      If replay_dir isn't None, the game's replay is saved there.
+    """
+    strategy, seed, max_ticks, decision_interval, replay_dir = job
+    start_time = perf_counter()
+
+    ai_game = AlienInvasion(headless=True, seed=seed)
+    ai_player = AIPlayer(ai_game, strategy, decision_interval)
+    ai_player.run_game(max_ticks)
+
+    if replay_dir is not None:
+        ai_game.replay.save(Path(replay_dir) / f"{strategy}_{seed}.replay")
+
+    stats = ai_game.stats
+    return {
+        'strategy': strategy,
+        'seed': seed,
+        'score': stats.score,
+        'level': stats.level,
+        'ticks': stats.ticks,
+        'seconds': perf_counter() - start_time,
+    }
+
+
+def run_batch(strategies, games, first_seed=0, max_ticks=None,
+        processes=None, replay_dir=None, decision_interval=1):
+    """Play games games with each strategy, and return all the results.
+
+    Every strategy plays the same seeds, so the strategies are compared
+      on the same sequence of games.
+    """
+    if replay_dir is not None:
+        Path(replay_dir).mkdir(parents=True, exist_ok=True)
+
+    jobs = [(strategy, seed, max_ticks, decision_interval, replay_dir)
+            for strategy in strategies
+            for seed in range(first_seed, first_seed + games)]
+
+    # Let the workers finish on their own. SDL handles SIGTERM in each
+    #   worker, so the pool can't terminate them when it exits.
+    with Pool(processes) as pool:
+        results = pool.map(play_game, jobs, chunksize=8)
+        pool.close()
+        pool.join()
+    return results
+
+
+def write_results(results, filename):
+    """Write results to a CSV or JSON file."""
+    path = Path(filename)
+    if path.suffix == '.json':
+        path.write_text(json.dumps(results, indent=2))
+    else:
+        with path.open('w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+
+
+def show_summary(results, strategies):
+    """Print the average result for each strategy."""
+    for strategy in strategies:
+        games = [r for r in results if r['strategy'] == strategy]
+        print(f"{strategy}: {len(games)} games, "
+                f"mean score {mean(r['score'] for r in games):,.0f}, "
+                f"mean level {mean(r['level'] for r in games):.1f}, "
+                f"mean ticks {mean(r['ticks'] for r in games):,.0f}")
+
+
+def parse_args():
+    """Read the batch settings from the command line."""
+    strategy_names = list(AIPlayer.strategies)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--strategies', nargs='+', choices=strategy_names,
+            default=strategy_names, help="strategies to compare")
+    parser.add_argument('--games', type=int, default=100,
+            help="number of games to play with each strategy")
+    parser.add_argument('--first-seed', type=int, default=0,
+            help="seed of the first game")
+    parser.add_argument('--max-ticks', type=int, default=None,
+            help="stop any game that runs longer than this")
+    parser.add_argument('--decision-interval', type=int, default=1,
+            help="minimum number of ticks between strategy decisions")
+    parser.add_argument('--processes', type=int, default=None,
+            help="number of worker processes (default: one per core)")
+    parser.add_argument('--output', default='results.csv',
+            help="results file; use a .json extension for JSON")
+    parser.add_argument('--replay-dir', default=None,
+            help="directory to save a replay of every game in")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    results = run_batch(args.strategies, args.games, args.first_seed,
+            args.max_ticks, args.processes, args.replay_dir,
+            args.decision_interval)
+    write_results(results, args.output)
+    show_summary(results, args.strategies)
+    print(f"Wrote {len(results)} results to {args.output}.")
@@ -0,0 +1,357 @@
+"""Time the game engine on a few scripted, seeded headless scenarios.
+
+Each scenario starts a new game with a fixed seed, and drives it with
+  the same simple script: sweep the ship right and left, and fire
+  whenever a bullet is available. The scenarios are:
+
+    full_fleet_max_bullets  Play from a full fleet, with as many bullets
+                            in the air as the game allows.
+    late_level              The same, after the game has sped up twenty
+                            times, as it would by level 21.
+    fleet_rebuilds          Clear the fleet and create a new one, over
+                            and over, as happens on every level and
+                            every lost ship.
+    sprite_blits            Draw the full fleet and the ship, over and
+                            over, to show what a frame's blits cost.
+
+Each scenario is timed several times, and the best time is kept. The
+  number of allocated memory blocks is sampled during the timed runs,
+  to show how many blocks the scenario holds at its peak, and how many
+  it still holds at the end. The scenario is then run once more under
+  tracemalloc to find its peak memory use.
+
+This version advances in fixed ticks, ticks_per_second times a game
+  second. Earlier versions advance once per frame, by distances that
+  differ from version to version; the AI player versions move twice as
+  far each tick as this one, so their ticks aren't the same length.
+  Tick scenarios report game seconds per second for versions that have
+  fixed ticks, and comparisons note when the two versions' ticks move
+  the fleet different distances.
+
+Any version of the game with a fleet, from chapter 13 on, can be
+  benchmarked by pointing --game-dir at its directory. Versions that
+  can't run headless are run with SDL's dummy video and audio drivers,
+  and the pause after the ship is hit is skipped. Scenarios a version
+  doesn't support are reported as skipped. Results can be saved as
+  JSON, and compared with an earlier run.
+
+Examples:
+    python benchmark.py --output new.json
+    python benchmark.py --game-dir ../../../chapter_14/scoring --output old.json
+    python benchmark.py --compare old.json
+"""
+
+import argparse
+import gc
+import importlib
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+
+
+def load_game_class(game_dir):
+    """Import the AlienInvasion class from the version in game_dir.
+
+    Each version's modules have the same names, so only one version can
+      be loaded in a process.
+    """
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+    # The game loads its images and sounds from paths relative to its
+    #   own directory.
+    os.chdir(game_dir)
+    sys.path.insert(0, str(game_dir))
+    module = importlib.import_module('alien_invasion')
+
+    if hasattr(module, 'sleep'):
+        # Older versions sleep when the ship is hit; don't time that.
+        module.sleep = lambda seconds: None
+    return module.AlienInvasion
+
+
+def make_game(game_class, seed):
+    """Start a new, active game with the given seed."""
+    random.seed(seed)
+    try:
+        ai_game = game_class(headless=True, seed=seed)
+    except TypeError:
+        # This version can't run headless, and has no seed of its own.
+        ai_game = game_class()
+
+    # Versions before chapter 13's ending_the_game have no stats.
+    if hasattr(ai_game, 'stats'):
+        ai_game.stats.game_active = True
+    return ai_game
+
+
+def play_tick(ai_game):
+    """Sweep the ship, fire if possible, and advance the game one tick."""
+    ship = ai_game.ship
+    screen_rect = ai_game.screen.get_rect()
+    if ship.rect.right >= screen_rect.right:
+        ship.moving_right = False
+        ship.moving_left = True
+    elif ship.rect.left <= 0 or not (ship.moving_left or ship.moving_right):
+        ship.moving_right = True
+        ship.moving_left = False
+    ai_game._fire_bullet()
+
+    if hasattr(ai_game, '_update_game'):
+        ai_game._update_game()
+    else:
+        ai_game.ship.update()
+        ai_game._update_bullets()
+        ai_game._update_aliens()
+
+    # Keep playing after the last ship is lost.
+    if hasattr(ai_game, 'stats') and ai_game.stats.ships_left < 1:
+        ai_game.stats.ships_left = ai_game.settings.ship_limit
+
+
+def speed_up(ai_game):
+    """Speed the game up twenty times, as it would be by level 21."""
+    for _ in range(20):
+        ai_game.settings.increase_speed()
+
+
+def rebuild_fleet(ai_game):
+    """Clear the fleet and create a new one."""
+    ai_game.aliens.empty()
+    ai_game._create_fleet()
+
+
+def draw_sprites(ai_game):
+    """Draw the fleet and the ship."""
+    if hasattr(ai_game, '_draw_fleet'):
+        ai_game._draw_fleet()
+    else:
+        ai_game.aliens.draw(ai_game.screen)
+    ai_game.ship.blitme()
+
+
+# Each scenario's setup function, the function for one step, the unit
+#   it counts, the default count, and the attributes a version needs to
+#   run it.
+SCENARIOS = {
+    'full_fleet_max_bullets': (None, play_tick, 'ticks', 5000,
+            ['_fire_bullet', '_update_aliens']),
+    'late_level': (speed_up, play_tick, 'ticks', 5000,
+            ['_fire_bullet', '_update_aliens', 'settings.increase_speed']),
+    'fleet_rebuilds': (None, rebuild_fleet, 'rebuilds', 500,
+            ['_create_fleet']),
+    'sprite_blits': (None, draw_sprites, 'frames', 2000,
+            ['aliens', 'ship.blitme']),
+}
+
+# How many steps pass between samples of the allocated memory blocks.
+SAMPLE_INTERVAL = 50
+
+
+def get_missing(ai_game, requirements):
+    """Return the required attributes that ai_game doesn't have."""
+    missing = []
+    for requirement in requirements:
+        owner = ai_game
+        for name in requirement.split('.'):
+            owner = getattr(owner, name, None)
+        if owner is None:
+            missing.append(requirement)
+    return missing
+
+
+def start_scenario(game_class, name, seed):
+    """Return a new game, set up for the named scenario."""
+    setup = SCENARIOS[name][0]
+    ai_game = make_game(game_class, seed)
+    if setup:
+        setup(ai_game)
+    return ai_game
+
+
+def run_steps(ai_game, step, count):
+    """Run step count times, and return its time and block counts.
+
+    The number of allocated memory blocks is sampled every
+      SAMPLE_INTERVAL steps. Returns the elapsed time, the most blocks
+      held above the starting number, and the blocks still held at the
+      end.
+    """
+    gc.collect()
+    start_blocks = sys.getallocatedblocks()
+    peak_blocks = start_blocks
+    start_time = perf_counter()
+    for step_number in range(count):
+        step(ai_game)
+        if step_number % SAMPLE_INTERVAL == 0:
+            peak_blocks = max(peak_blocks, sys.getallocatedblocks())
+    elapsed = perf_counter() - start_time
+
+    gc.collect()
+    end_blocks = sys.getallocatedblocks()
+    peak_blocks = max(peak_blocks, end_blocks)
+    return elapsed, peak_blocks - start_blocks, end_blocks - start_blocks
+
+
+def get_tick_length(ai_game):
+    """Return a tick's length in game seconds, and the fleet's step.
+
+    The length is None for versions without fixed ticks. The step is how
+      far the fleet moves each tick at the game's current speed, in pixels.
+    """
+    settings = ai_game.settings
+    ticks_per_second = getattr(settings, 'ticks_per_second', None)
+    if ticks_per_second is None:
+        return None, settings.alien_speed
+    return 1 / ticks_per_second, settings.alien_speed / ticks_per_second
+
+
+def run_scenario(game_class, name, count, seed, repeat):
+    """Run one scenario, and return its measurements."""
+    _, step, unit, _, requirements = SCENARIOS[name]
+    missing = get_missing(make_game(game_class, seed), requirements)
+    if missing:
+        return {'skipped': f"needs {', '.join(missing)}"}
+
+    # Keep the best of several timed runs, and the block counts from it.
+    best = None
+    for _ in range(repeat):
+        ai_game = start_scenario(game_class, name, seed)
+        run = run_steps(ai_game, step, count)
+        if best is None or run[0] < best[0]:
+            best = run
+    best_time, peak_blocks, net_blocks = best
+
+    # Measure memory in a separate run, because tracing slows it down.
+    ai_game = start_scenario(game_class, name, seed)
+    tick_seconds, fleet_step = get_tick_length(ai_game)
+    tracemalloc.start()
+    for _ in range(count):
+        step(ai_game)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        'unit': unit,
+        'count': count,
+        'seconds': best_time,
+        'per_second': count / best_time,
+        'peak_allocated_blocks': peak_blocks,
+        'net_allocated_blocks': net_blocks,
+        'peak_memory_kb': peak_memory / 1024,
+    }
+    if unit == 'ticks':
+        result['fleet_pixels_per_tick'] = fleet_step
+        if tick_seconds is not None:
+            result['game_seconds_per_second'] = (result['per_second']
+                    * tick_seconds)
+    return result
+
+
+def get_commit():
+    """Return the current git commit, or None if it can't be found."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(game_dir, names, seed=0, repeat=3, scale=1.0):
+    """Run the named scenarios against the game in game_dir.
+
+    scale multiplies the default count of each scenario.
+    """
+    game_dir = Path(game_dir).resolve()
+    game_class = load_game_class(game_dir)
+
+    import pygame
+    report = {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'commit': get_commit(),
+        'game_dir': str(game_dir),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'seed': seed,
+        'scenarios': {},
+    }
+    for name in names:
+        count = max(1, int(SCENARIOS[name][3] * scale))
+        report['scenarios'][name] = run_scenario(game_class, name, count,
+                seed, repeat)
+    return report
+
+
+def show_report(report, baseline=None):
+    """Print the results, compared with a baseline report if given."""
+    print(f"{report['game_dir']} at {report['commit']}")
+    for name, result in report['scenarios'].items():
+        if 'skipped' in result:
+            print(f"  {name}: skipped, {result['skipped']}")
+            continue
+
+        line = f"  {name}: {result['per_second']:,.0f} {result['unit']}/s"
+        if 'game_seconds_per_second' in result:
+            line += f" ({result['game_seconds_per_second']:,.1f} game s/s)"
+        line += (f", peak {result['peak_allocated_blocks']:+,} blocks, "
+                f"net {result['net_allocated_blocks']:+,} blocks, "
+                f"peak {result['peak_memory_kb']:,.0f} KB")
+        old_result = (baseline or {}).get('scenarios', {}).get(name, {})
+        if 'per_second' in old_result:
+            change = result['per_second'] / old_result['per_second'] - 1
+            line += f" ({change:+.1%} vs. baseline)"
+        print(line)
+
+        # Ticks that move the fleet different distances aren't the same
+        #   amount of game, so say so.
+        step = result.get('fleet_pixels_per_tick')
+        old_step = old_result.get('fleet_pixels_per_tick')
+        if step is not None and old_step is not None and step != old_step:
+            print(f"    Note: a tick moves the fleet {step:g} px here, and "
+                    f"{old_step:g} px in the baseline, so ticks/s aren't "
+                    f"directly comparable.")
+
+
+def parse_args():
+    """Read the benchmark settings from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--game-dir', default=Path(__file__).parent,
+            help="directory of the game version to benchmark")
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS),
+            default=list(SCENARIOS), help="scenarios to run")
+    parser.add_argument('--seed', type=int, default=0,
+            help="seed for every game")
+    parser.add_argument('--repeat', type=int, default=3,
+            help="number of timed runs of each scenario")
+    parser.add_argument('--scale', type=float, default=1.0,
+            help="multiply the length of every scenario by this")
+    parser.add_argument('--output', default=None,
+            help="JSON file to save the results in")
+    parser.add_argument('--compare', default=None,
+            help="JSON results of an earlier run to compare with")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    # Read and write files relative to where the benchmark was started,
+    #   before changing to the game's directory.
+    output = Path(args.output).resolve() if args.output else None
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+
+    report = run_benchmarks(args.game_dir, args.scenarios, args.seed,
+            args.repeat, args.scale)
+    show_report(report, baseline)
+    if output:
+        output.write_text(json.dumps(report, indent=2))
+        print(f"Wrote the results to {output}.")
@@ -0,0 +1,41 @@
+import pygame
+from pygame.sprite import Sprite
+ 
+class Bullet(Sprite):
+    """A class to manage bullets fired from the ship"""
+
+    def __init__(self, ai_game):
+        """Create a bullet object at the ship's current position."""
+        super().__init__()
+        self.screen = ai_game.screen
+        self.settings = ai_game.settings
+        self.ship = ai_game.ship
+        self.pool = ai_game.bullet_pool
+        self.color = self.settings.bullet_color
+
+        # Create a bullet rect at (0, 0) and then set correct position.
+        self.rect = pygame.Rect(0, 0, self.settings.bullet_width,
+            self.settings.bullet_height)
+        self.reset()
+
+    def reset(self):
+        """Move the bullet to the ship's current position."""
+        self.rect.midtop = self.ship.rect.midtop
+        
+        # Store the bullet's position as a decimal value.
+        self.y = float(self.rect.y)
+
+    def update(self, dt):
+        """Move the bullet up the screen over a time step of dt seconds."""
+        # Update the decimal position of the bullet.
+        self.y -= self.settings.bullet_speed * dt
+        # Update the rect position.
+        self.rect.y = self.y
+
+        # Return the bullet to the pool once it's off the screen.
+        if self.rect.bottom <= 0:
+            self.pool.recycle(self)
+
+    def draw_bullet(self):
+        """Draw the bullet to the screen."""
+        pygame.draw.rect(self.screen, self.color, self.rect)
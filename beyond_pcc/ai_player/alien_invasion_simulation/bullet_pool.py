@@ -0,0 +1,35 @@
+from bullet import Bullet
+
+
+class BulletPool:
+    """Keep bullets that are out of play, so they can be fired again.
+
+    Firing takes a bullet from the pool instead of making a new one, and
+      bullets go back to the pool when they leave the screen or hit an
+      alien. A game only ever makes as many bullets as it has had in play
+      at once.
+    """
+
+    def __init__(self, ai_game):
+        """Initialize an empty pool."""
+        self.ai_game = ai_game
+        self.bullets = []
+
+    def get_bullet(self):
+        """Return a bullet at the top of the ship, ready to fire."""
+        if self.bullets:
+            bullet = self.bullets.pop()
+            bullet.reset()
+            return bullet
+        return Bullet(self.ai_game)
+
+    def recycle(self, bullet):
+        """Take a bullet out of play, and keep it for later."""
+        if bullet.alive():
+            bullet.kill()
+            self.bullets.append(bullet)
+
+    def recycle_all(self, group):
+        """Take every bullet in group out of play, and keep them for later."""
+        self.bullets.extend(group.sprites())
+        group.empty()
@@ -0,0 +1,230 @@
+from bisect import bisect_right, insort
+from math import copysign
+
+
+def round_position(x):
+    """Round x the way a pygame rect does, half away from zero."""
+    return int(x + copysign(0.5, x))
+
+
+class FleetGrid:
+    """A uniform grid over the fleet, for fast collision checks.
+
+    The screen is divided into cells, and each alien is listed in every
+      cell its rect overlaps. A collision check only needs to look at the
+      aliens in the cells that the other rect overlaps, instead of at
+      every alien in the fleet.
+
+    The whole fleet moves and drops together, so aliens are filed under
+      the cells they covered when they were added. The grid keeps the
+      fleet's one exact horizontal position, and places every alien's
+      rect at its home position plus the fleet's offset, so the aliens
+      never drift out of formation. Queries are shifted by the offset
+      instead of refiling every alien.
+
+    The grid also keeps the fleet's rows and columns in order, so players
+      can find particular aliens, like the bottom-right alien or the
+      alien nearest the ship, without looking at the whole fleet. Moving
+      the fleet doesn't change the order, so these only change when an
+      alien is added or removed.
+    """
+
+    def __init__(self, cell_width, cell_height):
+        """Initialize an empty grid."""
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+
+        # Map each (column, row) cell to the set of aliens in it, and each
+        #   alien to its home position and the cells it's listed in.
+        self.cells = {}
+        self.homes = {}
+        self.alien_cells = {}
+
+        # Map each home position to its alien, each row's top to the
+        #   sorted lefts of its aliens, and each column's left to the
+        #   sorted tops of its aliens. The row tops and column lefts are
+        #   kept sorted as well.
+        self.aliens_at = {}
+        self.rows = {}
+        self.row_tops = []
+        self.columns = {}
+        self.column_lefts = []
+
+        # Counts every alien added or removed, so anything built from the
+        #   grid can tell when it's out of date.
+        self.changes = 0
+
+        # The fleet's exact horizontal distance from its home position, and
+        #   the whole-pixel offsets of every alien's rect from its home.
+        self.x = 0.0
+        self.offset_x = 0
+        self.offset_y = 0
+
+    def add(self, alien):
+        """Add an alien to the grid at its current position."""
+        offset_x, offset_y = self.get_offset()
+        home_rect = alien.rect.move(-offset_x, -offset_y)
+        self.homes[alien] = home_rect.topleft
+
+        alien_cells = self._get_cells(home_rect)
+        self.alien_cells[alien] = alien_cells
+        for cell in alien_cells:
+            self.cells.setdefault(cell, set()).add(alien)
+
+        self.changes += 1
+        home_x, home_y = home_rect.topleft
+        self.aliens_at[(home_x, home_y)] = alien
+        self._add_to_line(self.rows, self.row_tops, home_y, home_x)
+        self._add_to_line(self.columns, self.column_lefts, home_x, home_y)
+
+    def remove(self, alien):
+        """Remove an alien from the grid."""
+        self.changes += 1
+        home_x, home_y = self.homes.pop(alien)
+        del self.aliens_at[(home_x, home_y)]
+        self._remove_from_line(self.rows, self.row_tops, home_y, home_x)
+        self._remove_from_line(self.columns, self.column_lefts, home_x,
+                home_y)
+
+        for cell in self.alien_cells.pop(alien):
+            aliens = self.cells[cell]
+            aliens.discard(alien)
+            if not aliens:
+                del self.cells[cell]
+
+    def collide(self, rect):
+        """Return a list of the aliens that collide with rect."""
+        return [alien for alien in self._get_nearby_aliens(rect)
+                if alien.rect.colliderect(rect)]
+
+    def collide_any(self, rect):
+        """Return an alien that collides with rect, or None."""
+        for alien in self._get_nearby_aliens(rect):
+            if alien.rect.colliderect(rect):
+                return alien
+        return None
+
+    def move(self, distance):
+        """Move the whole fleet right by distance, or left if it's negative."""
+        if self.shift(distance):
+            for alien, (home_x, _) in self.homes.items():
+                alien.rect.x = home_x + self.offset_x
+
+    def drop(self, distance):
+        """Move the whole fleet down by distance."""
+        self.shift(0.0, distance)
+        for alien, (_, home_y) in self.homes.items():
+            alien.rect.y = home_y + self.offset_y
+
+    def shift(self, distance_x, distance_y=0):
+        """Move the fleet's position, but leave its aliens' rects alone.
+
+        This is for a fleet that places its own aliens, like ArrayFleet.
+          Returns True if the rects need to move to match the new offsets.
+        """
+        self.x += distance_x
+        offset_x = round_position(self.x)
+        moved = offset_x != self.offset_x or distance_y != 0
+        self.offset_x = offset_x
+        self.offset_y += distance_y
+        return moved
+
+    def get_offset(self):
+        """Return how far the fleet has moved since its aliens were added."""
+        return self.offset_x, self.offset_y
+
+    def get_bottom_right_alien(self):
+        """Return the right-most alien in the bottom row, or None."""
+        if not self.row_tops:
+            return None
+        bottom_top = self.row_tops[-1]
+        return self.aliens_at[(self.rows[bottom_top][-1], bottom_top)]
+
+    def get_lowest_alien(self, x):
+        """Return the lowest alien in the column over x, or None."""
+        offset_x, _ = self.get_offset()
+        index = bisect_right(self.column_lefts, x - offset_x) - 1
+        if index < 0:
+            return None
+
+        column_left = self.column_lefts[index]
+        if x - offset_x >= column_left + self.cell_width:
+            return None
+        return self.aliens_at[(column_left, self.columns[column_left][-1])]
+
+    def get_nearest_alien(self, rect):
+        """Return the alien nearest rect, or None.
+
+        rect should be below the fleet, like the ship's rect. Then the
+          nearest alien is always the lowest one in its column, so only
+          the lowest alien in each column is checked, working outward
+          from rect until the columns are too far away to be closer.
+        """
+        # Compare the aliens' home positions to where rect would be if
+        #   it had moved with the fleet. Work with the top left corners of
+        #   alien-sized rects, so columns can be compared by their lefts.
+        offset_x, offset_y = self.get_offset()
+        x = rect.centerx - offset_x - self.cell_width // 2
+        y = rect.centery - offset_y - self.cell_height // 2
+        column_lefts = self.column_lefts
+
+        nearest_alien, nearest_distance = None, None
+        right = bisect_right(column_lefts, x)
+        left = right - 1
+        while left >= 0 or right < len(column_lefts):
+            # Check whichever of the next columns is closer to rect.
+            if right == len(column_lefts) or (left >= 0
+                    and x - column_lefts[left] <= column_lefts[right] - x):
+                column_left = column_lefts[left]
+                left -= 1
+            else:
+                column_left = column_lefts[right]
+                right += 1
+
+            # No column past this one can have a closer alien.
+            dx = column_left - x
+            if nearest_distance is not None and dx * dx >= nearest_distance:
+                break
+
+            column_top = self.columns[column_left][-1]
+            dy = column_top - y
+            distance = dx * dx + dy * dy
+            if nearest_distance is None or distance < nearest_distance:
+                nearest_alien = self.aliens_at[(column_left, column_top)]
+                nearest_distance = distance
+
+        return nearest_alien
+
+    def _add_to_line(self, lines, line_keys, key, position):
+        """Add position to the row or column at key, in sorted order."""
+        if key not in lines:
+            lines[key] = []
+            insort(line_keys, key)
+        insort(lines[key], position)
+
+    def _remove_from_line(self, lines, line_keys, key, position):
+        """Remove position from the row or column at key."""
+        line = lines[key]
+        line.remove(position)
+        if not line:
+            del lines[key]
+            line_keys.remove(key)
+
+    def _get_nearby_aliens(self, rect):
+        """Return the set of aliens in the cells that rect overlaps."""
+        home_rect = rect.move(-self.offset_x, -self.offset_y)
+
+        nearby_aliens = set()
+        for cell in self._get_cells(home_rect):
+            nearby_aliens.update(self.cells.get(cell, ()))
+        return nearby_aliens
+
+    def _get_cells(self, rect):
+        """Return a list of all the cells that rect overlaps."""
+        first_col = rect.left // self.cell_width
+        last_col = (rect.right - 1) // self.cell_width
+        first_row = rect.top // self.cell_height
+        last_row = (rect.bottom - 1) // self.cell_height
+        return [(col, row)
+                for col in range(first_col, last_col + 1)
+                for row in range(first_row, last_row + 1)]
@@ -0,0 +1,116 @@
+import pygame
+
+from image_cache import prepare_image
+
+
+class FleetRenderer:
+    """Draw the fleet with one blit for each of its rows.
+
+    The aliens never move relative to each other, so each row of the fleet
+      is drawn once onto its own surface, and those surfaces are drawn at
+      the fleet's current offset every frame. The surfaces are only
+      redrawn when a new fleet is made. When an alien is shot down, its
+      spot on its row's surface is filled with the background color
+      instead.
+
+    The gaps between aliens are run-length encoded, which makes a surface
+      fast to draw but slow to change, since the whole surface has to be
+      encoded again. Keeping each row on its own surface means erasing an
+      alien only encodes one short strip, not the whole fleet.
+    """
+
+    def __init__(self, ai_game):
+        """Prepare to draw ai_game's fleet."""
+        self.ai_game = ai_game
+        self.bg_color = ai_game.settings.bg_color
+
+        # Map the home top of each row to its surface. Also keep the grid
+        #   the rows were drawn from, the number of changes the grid had
+        #   then, and the home left of every row's surface.
+        self.row_images = {}
+        self.fleet_grid = None
+        self.grid_changes = None
+        self.home_left = 0
+
+        # The home position of each alien still on a row's surface.
+        self.drawn_homes = {}
+
+    def draw(self, screen):
+        """Draw the fleet to screen."""
+        self._update_row_images()
+        offset_x, offset_y = self.fleet_grid.get_offset()
+        left = self.home_left + offset_x
+        screen.blits([(row_image, (left, home_top + offset_y))
+                for home_top, row_image in self.row_images.items()],
+                doreturn=False)
+
+    def get_rect(self):
+        """Return the rect the fleet covers on the screen, or None."""
+        self._update_row_images()
+        if not self.row_images:
+            return None
+
+        # Rows are kept from top to bottom.
+        offset_x, offset_y = self.fleet_grid.get_offset()
+        home_tops = list(self.row_images)
+        width, height = self.row_images[home_tops[0]].get_size()
+        return pygame.Rect(self.home_left + offset_x,
+                home_tops[0] + offset_y, width,
+                home_tops[-1] + height - home_tops[0])
+
+    def _update_row_images(self):
+        """Bring the rows' surfaces up to date, if the fleet has changed."""
+        fleet_grid = self.ai_game.fleet_grid
+        if fleet_grid is not self.fleet_grid:
+            self._draw_row_images(fleet_grid)
+        elif fleet_grid.changes != self.grid_changes:
+            self._erase_lost_aliens()
+
+    def _erase_lost_aliens(self):
+        """Erase the aliens that have left the fleet from their rows.
+
+        If any aliens have joined the fleet instead, every row is redrawn.
+        """
+        homes = self.fleet_grid.homes
+        lost_aliens = self.drawn_homes.keys() - homes.keys()
+        if len(homes) + len(lost_aliens) != len(self.drawn_homes):
+            self._draw_row_images(self.fleet_grid)
+            return
+
+        self.grid_changes = self.fleet_grid.changes
+        for alien in lost_aliens:
+            home_x, home_y = self.drawn_homes.pop(alien)
+            if home_y not in self.fleet_grid.rows:
+                # The row is empty, so it doesn't need to be drawn at all.
+                self.row_images.pop(home_y, None)
+            else:
+                self.row_images[home_y].fill(self.bg_color,
+                        (home_x - self.home_left, 0, alien.rect.width,
+                            alien.rect.height))
+
+    def _draw_row_images(self, fleet_grid):
+        """Draw every alien in fleet_grid onto new surfaces for its rows."""
+        self.fleet_grid = fleet_grid
+        self.grid_changes = fleet_grid.changes
+        self.drawn_homes = dict(fleet_grid.homes)
+        self.row_images = {}
+        if not fleet_grid.homes:
+            return
+
+        # Every row's surface spans the whole fleet, so they all line up.
+        left = fleet_grid.column_lefts[0]
+        width = fleet_grid.column_lefts[-1] + fleet_grid.cell_width - left
+        self.home_left = left
+
+        aliens_at = fleet_grid.aliens_at
+        for home_top in fleet_grid.row_tops:
+            row_image = pygame.Surface((width, fleet_grid.cell_height))
+            row_image.fill(self.bg_color)
+            row_image.blits([(aliens_at[(home_x, home_top)].image,
+                        (home_x - left, 0))
+                    for home_x in fleet_grid.rows[home_top]],
+                    doreturn=False)
+
+            # The space between the aliens is left out when a row is drawn.
+            self.row_images[home_top] = prepare_image(row_image,
+                    colorkey=self.bg_color)
@@ -0,0 +1,160 @@
+"""Time each phase of every frame, to see where a frame's time goes.
+
+Turn profiling on with settings.profile_frames. The profiler wraps the
+  game's methods for each phase, so a game that isn't being profiled
+  runs exactly the same code as before. The timings for recent frames
+  are kept in a ring buffer, shown on the screen by the scoreboard, and
+  saved to a CSV file when the game exits.
+
+In a headless game nothing is drawn, so each tick counts as a frame.
+"""
+
+import atexit
+import csv
+from time import perf_counter
+
+# Each phase, the object whose method it times, and the method's name.
+#   bullets includes the time spent in collisions.
+PHASES = (
+    ('events', 'game', '_check_events'),
+    ('ship', 'ship', 'update'),
+    ('bullets', 'game', '_update_bullets'),
+    ('collisions', 'game', '_check_bullet_alien_collisions'),
+    ('aliens', 'game', '_update_aliens'),
+    ('screen', 'game', '_update_screen'),
+)
+
+# The most recent profiler, whose timings are saved when the program
+#   exits. Only the latest one is kept, so every game's profile goes to
+#   the same file without older games being kept alive until exit.
+_latest_profiler = None
+
+
+def _dump_latest_profiler():
+    """Save the timings of the most recent profiler, if there is one."""
+    if _latest_profiler:
+        _latest_profiler.dump(
+                _latest_profiler.ai_game.settings.profile_filename)
+
+
+atexit.register(_dump_latest_profiler)
+
+
+class FrameProfiler:
+    """Record how long each phase of the last few hundred frames took."""
+
+    def __init__(self, ai_game, frames=600, overlay_interval=30):
+        """Start timing ai_game's phases.
+
+        Timings are kept for the last frames frames, and the scoreboard's
+          overlay is updated every overlay_interval frames.
+        """
+        self.ai_game = ai_game
+        self.frames = frames
+        self.overlay_interval = overlay_interval
+        self.phases = [phase for phase, _, _ in PHASES]
+
+        # A ring buffer of timings for each phase, and for whole frames.
+        #   frame_count is the total number of frames recorded so far.
+        self.timings = {phase: [0.0] * frames
+                for phase in self.phases + ['frame']}
+        self.frame_count = 0
+
+        # Time spent in each phase during the current frame.
+        self.frame_totals = dict.fromkeys(self.phases, 0.0)
+        self.frame_start = perf_counter()
+
+        for phase, owner_name, method_name in PHASES:
+            owner = ai_game.ship if owner_name == 'ship' else ai_game
+            method = getattr(owner, method_name)
+            setattr(owner, method_name, self._time(phase, method))
+
+        # A frame ends after the screen is drawn, or after each tick if
+        #   there is no screen.
+        end_method_name = '_update_game' if ai_game.headless else (
+                '_update_screen')
+        end_method = getattr(ai_game, end_method_name)
+        setattr(ai_game, end_method_name, self._end_frame_after(end_method))
+
+        global _latest_profiler
+        _latest_profiler = self
+
+    def get_percentile(self, phase, percent):
+        """Return a percentile of a phase's recent timings, in seconds."""
+        timings = sorted(self._get_recent(phase))
+        if not timings:
+            return 0.0
+        return timings[round((len(timings) - 1) * percent / 100)]
+
+    def get_fps(self):
+        """Return the average frame rate over the recent frames."""
+        frame_times = self._get_recent('frame')
+        total_time = sum(frame_times)
+        return len(frame_times) / total_time if total_time else 0.0
+
+    def get_report(self):
+        """Return lines summarizing the recent frames, for the overlay."""
+        lines = [f"fps {self.get_fps():.1f}"]
+        for phase in self.phases:
+            lines.append(f"{phase} p50 "
+                    f"{self.get_percentile(phase, 50) * 1000:.2f} p99 "
+                    f"{self.get_percentile(phase, 99) * 1000:.2f} ms")
+        return lines
+
+    def dump(self, filename):
+        """Write the recent timings to a CSV file, in milliseconds."""
+        columns = ['frame'] + self.phases
+        recent = [self._get_recent(column) for column in columns]
+        first_frame = self.frame_count - len(recent[0])
+
+        with open(filename, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame_number'] + [f"{column}_ms"
+                    for column in columns])
+            for offset, row in enumerate(zip(*recent)):
+                writer.writerow([first_frame + offset]
+                        + [f"{timing * 1000:.4f}" for timing in row])
+
+    def _time(self, phase, method):
+        """Return a version of method that adds its run time to phase."""
+        frame_totals = self.frame_totals
+
+        def timed_method(*args, **kwargs):
+            start = perf_counter()
+            result = method(*args, **kwargs)
+            frame_totals[phase] += perf_counter() - start
+            return result
+
+        return timed_method
+
+    def _end_frame_after(self, method):
+        """Return a version of method that ends the frame when it's done."""
+        def frame_ending_method(*args, **kwargs):
+            result = method(*args, **kwargs)
+            self._end_frame()
+            return result
+
+        return frame_ending_method
+
+    def _end_frame(self):
+        """Store the current frame's timings, and start a new frame."""
+        now = perf_counter()
+        index = self.frame_count % self.frames
+        self.timings['frame'][index] = now - self.frame_start
+        for phase, total in self.frame_totals.items():
+            self.timings[phase][index] = total
+            self.frame_totals[phase] = 0.0
+
+        self.frame_start = now
+        self.frame_count += 1
+        if self.frame_count % self.overlay_interval == 0:
+            self.ai_game.sb.prep_profile()
+
+    def _get_recent(self, phase):
+        """Return a phase's timings for the recent frames, oldest first."""
+        timings = self.timings[phase]
+        if self.frame_count < self.frames:
+            return timings[:self.frame_count]
+
+        index = self.frame_count % self.frames
+        return timings[index:] + timings[:index]
@@ -0,0 +1,95 @@
+"""A process-wide cache of images, so each image file is loaded only once.
+
+Every object that loads the same file gets the same Surface, so the
+  images handed out by the cache should be drawn, but never drawn on.
+
+Images are converted to the display's pixel format as they're loaded, so
+  drawing them doesn't need a conversion on every blit. Images loaded
+  before the display exists are converted by convert_all(), which should
+  be called as soon as the display is created.
+"""
+
+import pygame
+
+
+def prepare_image(image, alpha=False, colorkey=None):
+    """Return a copy of image that's as fast as possible to draw.
+
+    The copy is in the display's pixel format. With alpha, the image keeps
+      its per-pixel transparency. Otherwise, pixels of the colorkey color
+      are left out when it's drawn. Either way, the image is run-length
+      encoded, so transparent pixels are skipped in long runs.
+    """
+    if alpha:
+        image = image.convert_alpha()
+        image.set_alpha(255, pygame.RLEACCEL)
+    else:
+        image = image.convert()
+        if colorkey is not None:
+            image.set_colorkey(colorkey, pygame.RLEACCEL)
+    return image
+
+
+class ImageCache:
+    """Load images from disk once, and share them after that."""
+
+    def __init__(self):
+        """Start with an empty cache."""
+        self.images = {}
+
+        # Keys of images loaded before the display was created.
+        self.unconverted = set()
+
+        # Track how often the cache saves a trip to the disk.
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, filename, alpha=False, colorkey=None):
+        """Return the image in filename, loading it if needed.
+
+        Set alpha to keep the image's per-pixel transparency, or set
+          colorkey to leave out the pixels of one color when the image is
+          drawn. See prepare_image().
+        """
+        key = (filename, alpha, colorkey)
+        if key in self.images:
+            self.hits += 1
+            return self.images[key]
+
+        self.misses += 1
+        image = pygame.image.load(filename)
+        if pygame.display.get_surface():
+            image = prepare_image(image, alpha, colorkey)
+        else:
+            self.unconverted.add(key)
+
+        self.images[key] = image
+        return image
+
+    def convert_all(self):
+        """Convert any images loaded before the display was created.
+
+        Objects that already hold one of these images keep the unconverted
+          version, so call this before making any sprites.
+        """
+        for key in self.unconverted:
+            _, alpha, colorkey = key
+            self.images[key] = prepare_image(self.images[key], alpha,
+                    colorkey)
+        self.unconverted.clear()
+
+    def clear(self):
+        """Forget all loaded images, and reset the hit and miss counts."""
+        self.images.clear()
+        self.unconverted.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        """Return a summary of how well the cache is working."""
+        return (f"{len(self.images)} images cached, "
+                f"{self.hits} hits, {self.misses} misses")
+
+
+# The single cache shared by the whole program.
+image_cache = ImageCache()
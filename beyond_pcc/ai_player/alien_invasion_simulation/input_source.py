@@ -0,0 +1,71 @@
+"""Where the game's input events come from.
+
+A watched game reads events from SDL's queue, as usual. SDL is told to
+  drop every event type the game doesn't handle, such as mouse motion
+  and window events, before they're ever queued, so the game doesn't
+  have to wade through them each frame.
+
+Events can also be injected directly, without going through SDL at all.
+  AI players and replays post the same events a keyboard would, and
+  they're handled exactly like real keypresses. Injected events are
+  handled at the start of the next tick, rather than once a frame, so
+  each one takes effect on the tick it was posted for. A headless game
+  never reads SDL's queue, so injected events are its only input.
+"""
+
+import pygame
+
+# The only event types the game responds to.
+ALLOWED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+        pygame.MOUSEBUTTONDOWN]
+
+
+class InputSource:
+    """Collect the events the game should handle on each frame."""
+
+    def __init__(self, read_queue=True):
+        """Prepare to collect events.
+
+        If read_queue is True, events are read from SDL's queue as well as
+          being injected; the display must already be initialized.
+        """
+        self.read_queue = read_queue
+        self.injected = []
+
+        if self.read_queue:
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(ALLOWED_EVENTS)
+
+    def post(self, event_type, **attributes):
+        """Inject an event, to be handled on the next tick.
+
+        For example, post(pygame.KEYDOWN, key=pygame.K_SPACE) fires a bullet.
+        """
+        self.injected.append(pygame.event.Event(event_type, **attributes))
+
+    def post_movement(self, ship, moving_left, moving_right):
+        """Press or release the arrow keys, so ship moves the given way.
+
+        Only keys that need to change are posted, so holding a direction
+          doesn't post anything.
+        """
+        for key, moving, wanted in ((pygame.K_LEFT, ship.moving_left,
+                    moving_left), (pygame.K_RIGHT, ship.moving_right,
+                    moving_right)):
+            if wanted != moving:
+                self.post(pygame.KEYDOWN if wanted else pygame.KEYUP, key=key)
+
+    def post_fire(self):
+        """Press the fire key."""
+        self.post(pygame.KEYDOWN, key=pygame.K_SPACE)
+
+    def get_events(self):
+        """Return the events in SDL's queue, if it's being read."""
+        if self.read_queue:
+            return pygame.event.get()
+        return []
+
+    def get_injected(self):
+        """Return the events injected since the last call."""
+        events, self.injected = self.injected, []
+        return events
@@ -0,0 +1,237 @@
+"""Plan the AI player's moves by simulating a little of the game's future.
+
+The planner copies just the parts of the game that matter for the next
+  second or so: the ship's position, the bullets, and the fleet. The
+  fleet moves as one piece, so it's stored as an offset and the home
+  positions of the aliens still in it, organized by column. Copying this
+  state is cheap, so the planner can try many candidate moves and keep
+  the one that's expected to shoot down the most aliens.
+"""
+
+from copy import copy
+
+from fleet_grid import round_position
+
+# Ways the ship can move: left, stay put, or right.
+MOVES = (-1, 0, 1)
+
+
+class PlanState:
+    """A lightweight copy of a game's ship, bullets, and fleet."""
+
+    def __init__(self, ai_game):
+        """Copy the current state of ai_game."""
+        settings = ai_game.settings
+        dt = 1 / settings.ticks_per_second
+        screen_rect = ai_game.screen.get_rect()
+        self.screen_right = screen_rect.right
+        self.screen_bottom = screen_rect.bottom
+
+        # The ship's exact position and rect, and how far it moves in a
+        #   tick.
+        ship = ai_game.ship
+        self.ship_x = ship.x
+        self.ship_rect = ship.rect.copy()
+        self.ship_step = settings.ship_speed * dt
+
+        # Each bullet is an (exact y, rect left) pair.
+        self.bullets = [(bullet.y, bullet.rect.x)
+                for bullet in ai_game.bullets]
+        self.bullet_step = settings.bullet_speed * dt
+        self.bullet_width = settings.bullet_width
+        self.bullet_height = settings.bullet_height
+        self.bullets_allowed = settings.bullets_allowed
+
+        # Map the home left of each column in the fleet to a sorted tuple
+        #   of the home tops of its aliens. The fleet's rect offsets place
+        #   these homes on the screen. The horizontal offset is the fleet's
+        #   exact position, rounded the way its rects are rounded.
+        fleet_grid = ai_game.fleet_grid
+        self.columns = {column_left: tuple(column_tops)
+                for column_left, column_tops in fleet_grid.columns.items()}
+        self.alien_width = fleet_grid.cell_width
+        self.alien_height = fleet_grid.cell_height
+        self.fleet_x = fleet_grid.x
+        self.fleet_left, self.fleet_top = fleet_grid.get_offset()
+        self.fleet_direction = settings.fleet_direction
+        self.fleet_step = settings.alien_speed * dt
+        self.fleet_drop = settings.fleet_drop_speed
+
+        # How the simulation has gone so far.
+        self.ticks = 0
+        self.ship_hit = False
+
+    def copy(self):
+        """Return a copy of this state that can be stepped on its own."""
+        state = copy(self)
+        state.ship_rect = self.ship_rect.copy()
+        state.bullets = list(self.bullets)
+        state.columns = dict(self.columns)
+        return state
+
+    def step(self, move, fire):
+        """Advance one tick, the same way the game does.
+
+        move is -1, 0, or 1 to move left, stay, or move right. Returns the
+          number of aliens shot down during the tick.
+        """
+        self.ticks += 1
+
+        # Fire from the ship's current position.
+        if fire and len(self.bullets) < self.bullets_allowed:
+            ship_rect = self.ship_rect
+            self.bullets.append((float(ship_rect.y),
+                    ship_rect.centerx - self.bullet_width // 2))
+
+        # Move the ship.
+        if move > 0 and self.ship_rect.right < self.screen_right:
+            self.ship_x += self.ship_step
+        elif move < 0 and self.ship_rect.left > 0:
+            self.ship_x -= self.ship_step
+        self.ship_rect.x = self.ship_x
+
+        kills = self._update_bullets()
+        if self.columns:
+            self._update_fleet()
+        return kills
+
+    def get_aim_distance(self):
+        """Return the distance from the ship to the nearest column."""
+        ship_x = self.ship_rect.centerx - self.fleet_left
+        return min(abs(column_left + self.alien_width // 2 - ship_x)
+                for column_left in self.columns)
+
+    def _update_bullets(self):
+        """Move the bullets, and return how many aliens they shoot down."""
+        kills = 0
+        bullets = []
+        for y, left in self.bullets:
+            y -= self.bullet_step
+            top = round_position(y)
+            if top + self.bullet_height <= 0:
+                continue
+
+            hits = self._shoot_aliens(left - self.fleet_left,
+                    top - self.fleet_top)
+            if hits:
+                kills += hits
+            else:
+                bullets.append((y, left))
+
+        self.bullets = bullets
+        return kills
+
+    def _shoot_aliens(self, left, top):
+        """Remove the aliens a bullet at a home position overlaps.
+
+        Returns the number of aliens removed.
+        """
+        bottom = top + self.bullet_height
+        for column_left, column_tops in self.columns.items():
+            if not (column_left < left + self.bullet_width
+                    and left < column_left + self.alien_width):
+                continue
+
+            survivors = tuple(alien_top for alien_top in column_tops
+                    if not (alien_top < bottom
+                        and top < alien_top + self.alien_height))
+            hits = len(column_tops) - len(survivors)
+            if survivors:
+                self.columns[column_left] = survivors
+            else:
+                del self.columns[column_left]
+
+            # Columns are at least an alien width apart, so a bullet can
+            #   only hit aliens in one column.
+            return hits
+        return 0
+
+    def _update_fleet(self):
+        """Drop the fleet if it's at an edge, then move it.
+
+        Notes whether the fleet reaches the ship or the bottom of the
+          screen.
+        """
+        lefts = self.columns.keys()
+        left = min(lefts) + self.fleet_left
+        right = max(lefts) + self.alien_width + self.fleet_left
+        if right >= self.screen_right or left <= 0:
+            self.fleet_top += self.fleet_drop
+            self.fleet_direction *= -1
+
+        self.fleet_x += self.fleet_step * self.fleet_direction
+        self.fleet_left = round_position(self.fleet_x)
+
+        # Only the lowest alien in each column can reach the ship first.
+        ship_rect = self.ship_rect
+        for column_left, column_tops in self.columns.items():
+            alien_left = column_left + self.fleet_left
+            alien_bottom = column_tops[-1] + self.fleet_top + self.alien_height
+            if alien_bottom >= self.screen_bottom or (
+                    alien_bottom > ship_rect.top
+                    and alien_left < ship_rect.right
+                    and ship_rect.left < alien_left + self.alien_width):
+                self.ship_hit = True
+                return
+
+
+class Planner:
+    """Choose the ship's next move by simulating candidate moves ahead.
+
+    Each candidate is a move, with or without firing, for segment_ticks
+      ticks, followed by a move with firing for the rest of the horizon.
+      A candidate scores a point for each alien it shoots down, counting
+      earlier kills for more, and loses heavily if the ship is hit. Ties
+      go to the candidate that ends up lined up with the fleet.
+    """
+
+    def __init__(self, ai_game, segment_ticks=12, horizon=48, discount=0.98):
+        """Initialize the planner."""
+        self.ai_game = ai_game
+        self.segment_ticks = segment_ticks
+        self.horizon = horizon
+        self.discount = discount
+
+        # Losing a ship costs far more than any number of kills.
+        self.ship_hit_penalty = 1000.0
+
+    def plan(self):
+        """Return the best (move, fire) pair for the next segment."""
+        state = PlanState(self.ai_game)
+
+        best_action, best_value = None, None
+        for fire in (True, False):
+            for move in MOVES:
+                first_part = state.copy()
+                value = self._run(first_part, move, fire, self.segment_ticks)
+                if first_part.columns and not first_part.ship_hit:
+                    value += max(self._run(first_part.copy(), next_move, True,
+                            self.horizon - self.segment_ticks, aim=True)
+                        for next_move in MOVES)
+
+                if best_value is None or value > best_value:
+                    best_action, best_value = (move, fire), value
+
+        return best_action
+
+    def _run(self, state, move, fire, ticks, aim=False):
+        """Step state for a number of ticks, and return its value.
+
+        If aim is True, the value includes a small bonus for ending up
+          under the fleet.
+        """
+        value = 0.0
+        for _ in range(ticks):
+            kills = state.step(move, fire)
+            if kills:
+                value += kills * self.discount ** state.ticks
+            if state.ship_hit:
+                return value - self.ship_hit_penalty
+            if not state.columns:
+                # The fleet is gone; the next one is out of reach.
+                return value
+
+        if aim:
+            # Worth less than a single kill, however far away the fleet is.
+            value -= 0.5 * state.get_aim_distance() / state.screen_right
+        return value
@@ -0,0 +1,168 @@
+"""Record the inputs of a game, so the game can be played back exactly.
+
+The game itself has no randomness, so a game is completely determined by
+  its settings, its starting speeds, and the inputs on each tick. A
+  replay stores the settings that change how a game plays out, and one
+  byte per tick: whether the ship was moving left, whether it was moving
+  right, and whether a bullet was fired. The bytes are compressed with
+  zlib when the replay is saved.
+
+A replay recorded after a game was restored from a snapshot starts from
+  that snapshot instead, and stores it too.
+
+Example:
+    python replay.py targets_alien_7.replay
+"""
+
+import struct
+import sys
+import zlib
+
+from settings import Settings
+
+# Bits in each tick's input byte.
+MOVING_LEFT = 1
+MOVING_RIGHT = 2
+FIRED = 4
+
+# The settings that change how a game plays out, and how each is stored.
+#   A replay can only be played in a game with the same settings.
+GAME_SETTINGS = {
+    'screen_width': 'I',
+    'screen_height': 'I',
+    'ticks_per_second': 'I',
+    'ship_limit': 'I',
+    'bullet_width': 'I',
+    'bullet_height': 'I',
+    'bullets_allowed': 'I',
+    'fleet_drop_speed': 'I',
+    'array_fleet': '?',
+    'speedup_scale': 'd',
+    'score_scale': 'd',
+}
+SETTINGS = struct.Struct('<' + ''.join(GAME_SETTINGS.values()))
+
+# Replay files start with a fixed header: a magic string, a version
+#   number, the ship, bullet, and alien speeds at the start of the game,
+#   and the lengths of the seed and the snapshot the replay starts from.
+#   The seed can be any integer, so it's stored in as many bytes as it
+#   needs, followed by the game settings and the snapshot, if any.
+MAGIC = b'AIRP'
+VERSION = 1
+HEADER = struct.Struct('<4sBdddHI')
+
+
+def get_game_settings(settings):
+    """Return a dictionary of the settings that affect a game's outcome."""
+    return {name: getattr(settings, name) for name in GAME_SETTINGS}
+
+
+class Replay:
+    """A compact record of the inputs on every tick of a game."""
+
+    def __init__(self, seed, speeds, game_settings, inputs=b'',
+            snapshot=None):
+        """Start a replay of a game with the given seed and starting speeds.
+
+        speeds is a (ship_speed, bullet_speed, alien_speed) tuple, and
+          game_settings is a dictionary from get_game_settings(). If the
+          game was restored from a snapshot, snapshot holds its bytes, and
+          the inputs are played from there.
+        """
+        self.seed = seed
+        self.speeds = tuple(speeds)
+        self.game_settings = dict(game_settings)
+        self.inputs = bytearray(inputs)
+        self.snapshot = bytes(snapshot) if snapshot else None
+
+    def record(self, ship, fired):
+        """Record the inputs for one tick."""
+        self.inputs.append(MOVING_LEFT * ship.moving_left
+                | MOVING_RIGHT * ship.moving_right
+                | FIRED * fired)
+
+    def save(self, filename):
+        """Write the replay to a file."""
+        seed_bytes = self.seed.to_bytes(
+                self.seed.bit_length() // 8 + 1, 'little', signed=True)
+        snapshot = self.snapshot or b''
+        header = HEADER.pack(MAGIC, VERSION, *self.speeds, len(seed_bytes),
+                len(snapshot))
+        game_settings = SETTINGS.pack(*self.game_settings.values())
+        with open(filename, 'wb') as f:
+            f.write(header + seed_bytes + game_settings + snapshot
+                    + zlib.compress(bytes(self.inputs)))
+
+    @classmethod
+    def load(cls, filename):
+        """Read a replay from a file."""
+        with open(filename, 'rb') as f:
+            data = f.read()
+
+        (magic, version, *speeds, seed_length,
+                snapshot_length) = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{filename} is not a version {VERSION} replay.")
+
+        offset = HEADER.size
+        seed = int.from_bytes(data[offset:offset + seed_length], 'little',
+                signed=True)
+        offset += seed_length
+        game_settings = dict(zip(GAME_SETTINGS,
+                SETTINGS.unpack_from(data, offset)))
+        offset += SETTINGS.size
+        snapshot = data[offset:offset + snapshot_length]
+        inputs = zlib.decompress(data[offset + snapshot_length:])
+        return cls(seed, speeds, game_settings, inputs, snapshot)
+
+    def make_settings(self):
+        """Return new Settings with the game settings of this replay."""
+        settings = Settings()
+        for name, value in self.game_settings.items():
+            setattr(settings, name, value)
+        return settings
+
+    def play(self, ai_game):
+        """Play the recorded inputs in ai_game, as fast as possible.
+
+        ai_game should be a new headless game, made with the settings from
+          make_settings(). Its stats are returned when the inputs run out.
+        """
+        settings = ai_game.settings
+        different = [name for name, value in self.game_settings.items()
+                if getattr(settings, name) != value]
+        if different:
+            raise ValueError("The game's settings don't match the replay's: "
+                    f"{', '.join(different)}.")
+
+        (settings.ship_speed, settings.bullet_speed,
+                settings.alien_speed) = self.speeds
+        ai_game._start_replay()
+        ai_game.stats.game_active = True
+        if self.snapshot:
+            # Restoring the snapshot starts a matching replay in ai_game.
+            ai_game.restore(self.snapshot)
+
+        # Press the keys each tick's inputs call for, as a player would.
+        ship = ai_game.ship
+        input_source = ai_game.input_source
+        for tick_inputs in self.inputs:
+            input_source.post_movement(ship,
+                    bool(tick_inputs & MOVING_LEFT),
+                    bool(tick_inputs & MOVING_RIGHT))
+            if tick_inputs & FIRED:
+                input_source.post_fire()
+            ai_game._update_game()
+
+        return ai_game.stats
+
+
+if __name__ == '__main__':
+    from alien_invasion import AlienInvasion
+
+    replay = Replay.load(sys.argv[1])
+    ai_game = AlienInvasion(headless=True, seed=replay.seed,
+            settings=replay.make_settings())
+    stats = replay.play(ai_game)
+    print(f"Seed: {replay.seed}, score: {stats.score:,}, "
+            f"level: {stats.level}, ticks: {stats.ticks:,}")
@@ -0,0 +1,193 @@
+import pygame
+import pygame.font
+from pygame.sprite import Group
+ 
+from image_cache import prepare_image
+from ship import Ship
+
+class Scoreboard:
+    """A class to report scoring information."""
+
+    def __init__(self, ai_game):
+        """Initialize scorekeeping attributes."""
+        self.ai_game = ai_game
+        self.screen = ai_game.screen
+        self.screen_rect = self.screen.get_rect()
+        self.settings = ai_game.settings
+        self.stats = ai_game.stats
+        
+        # Font settings for scoring information.
+        self.text_color = (30, 30, 30)
+        self.font = pygame.font.SysFont(None, 48)
+        self.profile_font = pygame.font.SysFont(None, 24)
+
+        # A headless game never draws the scoreboard, so there's no need
+        #   to render any of its images.
+        self.headless = ai_game.headless
+
+        # Rendered text, keyed by (text, font, color, background color).
+        #   Scores are assembled from the cached images of their
+        #   characters, so each digit only needs to be rendered once.
+        self.text_images = {}
+
+        # The values shown in the current images. An image is only remade
+        #   when the value it shows changes.
+        self.shown_score = None
+        self.shown_high_score = None
+        self.shown_level = None
+        self.ships = Group()
+
+        # Frame timings are only shown when the game is being profiled.
+        self.profile_image = None
+
+        # Prepare the initial score images.
+        self.prep_score()
+        self.prep_high_score()
+        self.prep_level()
+        self.prep_ships()
+
+    def prep_score(self):
+        """Turn the score into a rendered image."""
+        if self.headless:
+            return
+
+        rounded_score = round(self.stats.score, -1)
+        if rounded_score == self.shown_score:
+            return
+
+        self.shown_score = rounded_score
+        self.score_image = self._render_number(rounded_score)
+
+        # Display the score at the top right of the screen.
+        self.score_rect = self.score_image.get_rect()
+        self.score_rect.right = self.screen_rect.right - 20
+        self.score_rect.top = 20
+
+    def prep_high_score(self):
+        """Turn the high score into a rendered image."""
+        if self.headless:
+            return
+
+        high_score = round(self.stats.high_score, -1)
+        if high_score == self.shown_high_score:
+            return
+
+        self.shown_high_score = high_score
+        self.high_score_image = self._render_number(high_score)
+
+        # Center the high score at the top of the screen.
+        self.high_score_rect = self.high_score_image.get_rect()
+        self.high_score_rect.centerx = self.screen_rect.centerx
+        self.high_score_rect.top = self.score_rect.top
+
+    def prep_level(self):
+        """Turn the level into a rendered image."""
+        if self.headless:
+            return
+
+        if self.stats.level == self.shown_level:
+            return
+
+        self.shown_level = self.stats.level
+        self.level_image = self._render_text(str(self.stats.level))
+
+        # Position the level below the score.
+        self.level_rect = self.level_image.get_rect()
+        self.level_rect.right = self.score_rect.right
+        self.level_rect.top = self.score_rect.bottom + 10
+
+    def prep_ships(self):
+        """Show how many ships are left."""
+        if self.headless or len(self.ships) == self.stats.ships_left:
+            return
+
+        self.ships = Group()
+        for ship_number in range(self.stats.ships_left):
+            ship = Ship(self.ai_game)
+            ship.rect.x = 10 + ship_number * ship.rect.width
+            ship.rect.y = 10
+            self.ships.add(ship)
+
+    def prep_profile(self):
+        """Turn the profiler's latest timings into a rendered image."""
+        if self.headless:
+            return
+
+        line_images = [self._render_chars(line, self.profile_font)
+                for line in self.ai_game.profiler.get_report()]
+
+        width = max(image.get_width() for image in line_images)
+        height = sum(image.get_height() for image in line_images)
+        profile_image = pygame.Surface((width, height))
+        profile_image.fill(self.settings.bg_color)
+
+        y = 0
+        for image in line_images:
+            profile_image.blit(image, (0, y))
+            y += image.get_height()
+        self.profile_image = prepare_image(profile_image,
+                colorkey=self.settings.bg_color)
+
+        # Show the timings at the left of the screen, below the ships.
+        self.profile_rect = self.profile_image.get_rect()
+        self.profile_rect.left = 10
+        self.profile_rect.top = 20 + self.ai_game.ship.rect.height
+
+    def _render_text(self, text, font=None):
+        """Return a rendered image of text, rendering it only once."""
+        if font is None:
+            font = self.font
+        key = (text, font, self.text_color, self.settings.bg_color)
+        if key not in self.text_images:
+            text_image = font.render(text, True, self.text_color,
+                    self.settings.bg_color)
+            self.text_images[key] = prepare_image(text_image,
+                    colorkey=self.settings.bg_color)
+        return self.text_images[key]
+
+    def _render_number(self, number):
+        """Build an image of number from cached images of its characters."""
+        return self._render_chars("{:,}".format(number))
+
+    def _render_chars(self, text, font=None):
+        """Build an image of text from cached images of its characters.
+
+        Use this for text that changes often, so that each version of it
+          doesn't get its own entry in the cache.
+        """
+        char_images = [self._render_text(char, font) for char in text]
+
+        width = sum(image.get_width() for image in char_images)
+        height = max(image.get_height() for image in char_images)
+        text_image = pygame.Surface((width, height))
+        text_image.fill(self.settings.bg_color)
+
+        x = 0
+        for image in char_images:
+            text_image.blit(image, (x, 0))
+            x += image.get_width()
+        return prepare_image(text_image, colorkey=self.settings.bg_color)
+
+    def check_high_score(self):
+        """Check to see if there's a new high score."""
+        if self.stats.score > self.stats.high_score:
+            self.stats.high_score = self.stats.score
+            self.prep_high_score()
+
+    def get_rects(self):
+        """Return copies of the rects of everything the scoreboard draws."""
+        rects = [self.score_rect.copy(), self.high_score_rect.copy(),
+                self.level_rect.copy()]
+        rects += [ship.rect.copy() for ship in self.ships.sprites()]
+        if self.profile_image:
+            rects.append(self.profile_rect.copy())
+        return rects
+
+    def show_score(self):
+        """Draw scores, level, and ships to the screen."""
+        self.screen.blit(self.score_image, self.score_rect)
+        self.screen.blit(self.high_score_image, self.high_score_rect)
+        self.screen.blit(self.level_image, self.level_rect)
+        self.ships.draw(self.screen)
+        if self.profile_image:
+            self.screen.blit(self.profile_image, self.profile_rect)
@@ -0,0 +1,79 @@
+class Settings:
+    """A class to store all settings for Alien Invasion."""
+
+    def __init__(self):
+        """Initialize the game's static settings."""
+        # Screen settings
+        self.screen_width = 1200
+        self.screen_height = 800
+        self.bg_color = (230, 230, 230)
+
+        # When True, only the parts of the screen that changed are redrawn
+        #   each frame. When False, the whole screen is redrawn.
+        self.dirty_rect_rendering = True
+        # When True, the fleet is drawn with one blit for each row, from
+        #   surfaces holding the row's aliens. When False, each alien is
+        #   drawn separately.
+        self.fleet_surface_rendering = True
+
+        # Timing settings
+        # The game logic advances in fixed steps, ticks_per_second times a
+        #   second. The screen is redrawn at most frames_per_second times a
+        #   second. If a frame takes longer than max_frame_time seconds, the
+        #   game slows down rather than trying to catch up all at once.
+        self.ticks_per_second = 120
+        self.frames_per_second = 60
+        self.max_frame_time = 0.1
+
+        # Profiling settings
+        # When True, the time spent in each phase of every frame is
+        #   recorded and shown on the screen, and the timings of the last
+        #   few hundred frames are saved to profile_filename on exit.
+        self.profile_frames = False
+        self.profile_filename = 'frame_profile.csv'
+
+        # Ship settings
+        self.ship_limit = 3
+        # Seconds the game pauses after the ship is hit.
+        self.ship_hit_pause = 0.5
+
+        # Bullet settings
+        self.bullet_width = 3
+        self.bullet_height = 15
+        self.bullet_color = (60, 60, 60)
+        self.bullets_allowed = 3
+
+        # Alien settings
+        self.fleet_drop_speed = 10
+        # When True, the fleet keeps alien positions in NumPy arrays, and
+        #   moves, drops, and checks all the aliens against the screen's
+        #   edges at once. This requires NumPy.
+        self.array_fleet = False
+
+        # How quickly the game speeds up
+        self.speedup_scale = 1.1
+        # How quickly the alien point values increase
+        self.score_scale = 1.5
+
+        self.initialize_dynamic_settings()
+
+    def initialize_dynamic_settings(self):
+        """Initialize settings that change throughout the game."""
+        # Speeds are in pixels per second.
+        self.ship_speed = 180.0
+        self.bullet_speed = 360.0
+        self.alien_speed = 120.0
+
+        # fleet_direction of 1 represents right; -1 represents left.
+        self.fleet_direction = 1
+
+        # Scoring
+        self.alien_points = 50
+
+    def increase_speed(self):
+        """Increase speed settings and alien point values."""
+        self.ship_speed *= self.speedup_scale
+        self.bullet_speed *= self.speedup_scale
+        self.alien_speed *= self.speedup_scale
+
+        self.alien_points = int(self.alien_points * self.score_scale)
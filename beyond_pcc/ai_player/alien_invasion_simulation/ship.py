@@ -0,0 +1,53 @@
+from pygame.sprite import Sprite
+
+from image_cache import image_cache
+ 
+class Ship(Sprite):
+    """A class to manage the ship."""
+ 
+    def __init__(self, ai_game):
+        """Initialize the ship and set its starting position."""
+        super().__init__()
+        self.screen = ai_game.screen
+        self.settings = ai_game.settings
+        self.screen_rect = ai_game.screen.get_rect()
+
+        # Load the ship image and get its rect. The ships shown on the
+        #   scoreboard share this image. The image's background is the same
+        #   color as the screen, so it doesn't need to be drawn.
+        self.image = image_cache.load('images/ship.bmp',
+                colorkey=self.settings.bg_color)
+        self.rect = self.image.get_rect()
+
+        # Start each new ship at the bottom center of the screen.
+        self.rect.midbottom = self.screen_rect.midbottom
+
+        # Store a decimal value for the ship's horizontal position.
+        self.x = float(self.rect.x)
+
+        # Movement flags
+        self.moving_right = False
+        self.moving_left = False
+
+    def update(self, dt):
+        """Update the ship's position based on movement flags.
+
+        dt is the length of the time step, in seconds.
+        """
+        # Update the ship's x value, not the rect.
+        if self.moving_right and self.rect.right < self.screen_rect.right:
+            self.x += self.settings.ship_speed * dt
+        if self.moving_left and self.rect.left > 0:
+            self.x -= self.settings.ship_speed * dt
+
+        # Update rect object from self.x.
+        self.rect.x = self.x
+
+    def blitme(self):
+        """Draw the ship at its current location."""
+        self.screen.blit(self.image, self.rect)
+
+    def center_ship(self):
+        """Center the ship on the screen."""
+        self.rect.midbottom = self.screen_rect.midbottom
+        self.x = float(self.rect.x)
@@ -0,0 +1,175 @@
+"""Save the full state of a game as bytes, and restore it later.
+
+A snapshot holds everything that decides how a game plays out from a
+  given tick: the stats, the speeds and other settings that change
+  during a game, the ship, the bullets in the air, the aliens left in
+  the fleet, and the state of the game's random number generator.
+  Images, sounds, and the screen aren't saved; they're the same in
+  every game.
+
+The fleet always has the same layout, so an alien is saved as just its
+  index in the layout. The whole fleet moves together, so the fleet's
+  exact horizontal position and its vertical offset place every alien.
+  A snapshot of a full fleet and a few bullets is about 2.7 KB, most of
+  which is the random number generator, and it's quick enough to take
+  every tick.
+
+Snapshots let a game be saved and loaded, let an AI player try out
+  several moves from the same position, and let a crash be reproduced
+  from the tick just before it happened.
+"""
+
+import random
+import struct
+
+from fleet_grid import FleetGrid
+
+# Snapshots start with a fixed header: a magic string, a version number,
+#   the length of the game's seed, stats, changing settings, the pause
+#   after the ship was hit, the ship's position and movement flags, the
+#   fleet's size and position, and the number of aliens and bullets that
+#   follow. The seed can be any integer, so it's
+#   stored after the header in as many bytes as it needs.
+MAGIC = b'AISS'
+VERSION = 1
+HEADER = struct.Struct('<4sBHQQQIi?IdddbQd??IdiII')
+
+# The state of random.Random: its words, and any saved Gaussian value.
+RNG_STATE = struct.Struct('<625I?d')
+
+
+def take_snapshot(ai_game):
+    """Return the full state of ai_game as bytes."""
+    stats = ai_game.stats
+    settings = ai_game.settings
+    ship = ai_game.ship
+
+    # Find the index of each alien left in the fleet.
+    fleet_grid = ai_game.fleet_grid
+    alien_indexes = [index
+            for index, alien in enumerate(ai_game.fleet_aliens)
+            if alien in fleet_grid.homes]
+    _, offset_y = fleet_grid.get_offset()
+
+    bullets = ai_game.bullets.sprites()
+    count = len(alien_indexes)
+    bullet_count = len(bullets)
+
+    seed_bytes = ai_game.seed.to_bytes(ai_game.seed.bit_length() // 8 + 1,
+            'little', signed=True)
+    header = HEADER.pack(MAGIC, VERSION, len(seed_bytes), stats.ticks,
+            stats.score, stats.high_score, stats.level, stats.ships_left,
+            stats.game_active, ai_game.respawn_ticks, settings.ship_speed,
+            settings.bullet_speed, settings.alien_speed,
+            settings.fleet_direction, settings.alien_points, ship.x,
+            ship.moving_left, ship.moving_right, len(ai_game.fleet_aliens),
+            fleet_grid.x, offset_y, count, bullet_count)
+
+    _, words, gauss_next = ai_game.rng.getstate()
+    rng_state = RNG_STATE.pack(*words, gauss_next is not None,
+            gauss_next or 0.0)
+
+    return b''.join([header, seed_bytes, rng_state,
+            struct.pack(f'<{count}I', *alien_indexes),
+            struct.pack(f'<{bullet_count}i{bullet_count}d',
+                *[bullet.rect.x for bullet in bullets],
+                *[bullet.y for bullet in bullets])])
+
+
+def restore_snapshot(ai_game, data):
+    """Put ai_game back into the state saved in data.
+
+    ai_game must have the same screen size as the game the snapshot was
+      taken from, so its fleet has the same layout. The game's replay
+      starts over from the snapshot.
+    """
+    (magic, version, seed_length, ticks, score, high_score, level,
+            ships_left, game_active, respawn_ticks, ship_speed, bullet_speed, alien_speed, fleet_direction,
+            alien_points, ship_x, moving_left, moving_right, fleet_size,
+            fleet_x, offset_y, count, bullet_count) = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"This is not a version {VERSION} snapshot.")
+    if fleet_size != len(ai_game.fleet_aliens):
+        raise ValueError("This snapshot is from a game with a different "
+                "fleet layout.")
+
+    offset = HEADER.size
+    seed = int.from_bytes(data[offset:offset + seed_length], 'little',
+            signed=True)
+    offset += seed_length
+    *words, has_gauss, gauss_next = RNG_STATE.unpack_from(data, offset)
+    offset += RNG_STATE.size
+    alien_indexes = struct.unpack_from(f'<{count}I', data, offset)
+    offset += struct.calcsize(f'<{count}I')
+    bullets = struct.unpack_from(f'<{bullet_count}i{bullet_count}d', data,
+            offset)
+
+    ai_game.seed = seed
+    ai_game.rng.setstate((random.Random.VERSION, tuple(words),
+            gauss_next if has_gauss else None))
+
+    stats = ai_game.stats
+    stats.ticks, stats.score, stats.high_score = ticks, score, high_score
+    stats.level, stats.ships_left = level, ships_left
+    stats.game_active = game_active
+    ai_game.respawn_ticks = respawn_ticks
+
+    # Inputs posted for the next tick belong to the old state, so they're
+    #   dropped.
+    ai_game.input_source.get_injected()
+
+    settings = ai_game.settings
+    (settings.ship_speed, settings.bullet_speed,
+            settings.alien_speed) = ship_speed, bullet_speed, alien_speed
+    settings.fleet_direction = fleet_direction
+    settings.alien_points = alien_points
+
+    ship = ai_game.ship
+    ship.x = ship_x
+    ship.rect.x = ship_x
+    ship.moving_left, ship.moving_right = moving_left, moving_right
+
+    # The game may not be the one the snapshot was taken from, so a new
+    #   replay is started that plays back from the snapshot. Any shot
+    #   fired before the snapshot is already among its bullets.
+    ai_game._start_replay(data)
+
+    _restore_fleet(ai_game, alien_indexes, fleet_x, offset_y)
+    _restore_bullets(ai_game, bullets[:bullet_count], bullets[bullet_count:])
+
+    # Bring the scoreboard up to date, and redraw the whole screen.
+    ai_game.sb.prep_score()
+    ai_game.sb.prep_high_score()
+    ai_game.sb.prep_level()
+    ai_game.sb.prep_ships()
+    ai_game.drawn_rects = None
+
+
+def _restore_fleet(ai_game, alien_indexes, fleet_x, offset_y):
+    """Rebuild the fleet from its aliens' indexes and its position."""
+    # Aliens are added to a new grid at their home positions, and then
+    #   the fleet is moved to where it was, just as it moved in the game.
+    fleet_grid = FleetGrid(*ai_game.alien_size)
+    aliens = [ai_game.fleet_aliens[index] for index in alien_indexes]
+    for alien, index in zip(aliens, alien_indexes):
+        alien.rect.topleft = ai_game.fleet_layout[index]
+        fleet_grid.add(alien)
+    fleet_grid.move(fleet_x)
+    fleet_grid.drop(offset_y)
+
+    # Aliens are added to the group once they're in the game's grid, so
+    #   an array fleet can find their home positions.
+    ai_game.fleet_grid = fleet_grid
+    ai_game.aliens.empty()
+    ai_game.aliens.add(aliens)
+
+
+def _restore_bullets(ai_game, lefts, ys):
+    """Put bullets back in the air at the given positions, in order."""
+    ai_game.bullet_pool.recycle_all(ai_game.bullets)
+    for left, y in zip(lefts, ys):
+        bullet = ai_game.bullet_pool.get_bullet()
+        bullet.rect.x = left
+        bullet.y = y
+        bullet.rect.y = y
+        ai_game.bullets.add(bullet)
@@ -0,0 +1,65 @@
+"""Sound effects, loaded only when a game is going to play them.
+
+Nothing here touches the mixer when the module is imported. A watched
+  game makes a SoundEffects object, which starts the mixer and loads
+  every sound the first time a sound is played. A headless game uses
+  SilentSoundEffects instead, which never touches audio at all.
+"""
+
+import pygame
+
+# The sound file for each effect.
+SOUND_FILES = {
+    'bullet': 'sounds/laser1.wav',
+    'alien': 'sounds/Explosion_02.wav',
+}
+
+
+class SoundEffects:
+    """Play the game's sound effects on a limited number of channels."""
+
+    def __init__(self, channels=4):
+        """Prepare to play sounds on up to channels sounds at once."""
+        self.channels = channels
+        self.sounds = None
+
+        # Set to False if the mixer can't start, so the game runs silently.
+        self.enabled = True
+
+    def load(self):
+        """Start the mixer, and load every sound effect."""
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            # There's no audio device to play sounds on.
+            self.enabled = False
+            return
+
+        pygame.mixer.set_num_channels(self.channels)
+        self.sounds = {name: pygame.mixer.Sound(filename)
+                for name, filename in SOUND_FILES.items()}
+
+    def play(self, name):
+        """Start playing a sound effect, and return right away.
+
+        If every channel is busy, the sound is skipped rather than cutting
+          off a sound that's already playing.
+        """
+        if self.sounds is None and self.enabled:
+            self.load()
+        if not self.enabled:
+            return
+
+        channel = pygame.mixer.find_channel()
+        if channel:
+            channel.play(self.sounds[name])
+
+
+class SilentSoundEffects:
+    """Stand-in for SoundEffects that never plays anything."""
+
+    def load(self):
+        """Do nothing; there's nothing to load."""
+
+    def play(self, name):
+        """Do nothing."""
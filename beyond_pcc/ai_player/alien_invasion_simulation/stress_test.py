@@ -0,0 +1,158 @@
+"""Play on much larger playfields, to see how the engine scales.
+
+Each stress run makes the screen scale times wider and taller than
+  usual, which gives the fleet roughly scale**2 times as many aliens,
+  and lets hundreds of bullets be in the air at once. The game runs
+  with SDL's dummy video driver, so the screen is a surface in memory
+  that's never shown, and it can be far larger than any real display.
+  The ship sweeps right and left and fires on every tick, as in
+  benchmark.py.
+
+Each run plays some warmup ticks first, so the bullets can fill up the
+  playfield, and then times the ticks that follow. A tick's time is
+  split into its collision checks and everything else, and a frame is
+  drawn every ticks_per_second // frames_per_second ticks, as the real
+  game would. The results for each scale show how the time per tick
+  and per frame grow with the number of aliens and bullets.
+
+Examples:
+    python stress_test.py
+    python stress_test.py --scales 1 2 4 8 --bullets 1000 --output stress.json
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+from time import perf_counter
+
+from settings import Settings
+from alien_invasion import AlienInvasion
+from benchmark import play_tick
+from sound_effects import SilentSoundEffects
+
+
+def make_stress_settings(scale, bullets_allowed):
+    """Return settings for a playfield scale times the usual size."""
+    settings = Settings()
+    settings.screen_width *= scale
+    settings.screen_height *= scale
+    settings.bullets_allowed = bullets_allowed
+    return settings
+
+
+def get_percentile(timings, percent):
+    """Return a percentile of a list of timings."""
+    timings = sorted(timings)
+    if not timings:
+        return 0.0
+    return timings[round((len(timings) - 1) * percent / 100)]
+
+
+def run_stress_test(scale, bullets_allowed, ticks, warmup_ticks, seed=0):
+    """Play one stress run, and return its measurements in milliseconds."""
+    # A headless game never draws, so use the dummy drivers instead.
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    settings = make_stress_settings(scale, bullets_allowed)
+    ai_game = AlienInvasion(seed=seed, settings=settings)
+    ai_game.stats.game_active = True
+
+    # Only time the engine, not the mixer.
+    ai_game.sound_effects = SilentSoundEffects()
+    fleet_size = len(ai_game.aliens)
+    ticks_per_frame = max(1, (settings.ticks_per_second
+            // settings.frames_per_second))
+
+    # Time the collision checks separately from the rest of the tick.
+    collision_times = []
+    check_collisions = ai_game._check_bullet_alien_collisions
+
+    def timed_check_collisions():
+        start = perf_counter()
+        check_collisions()
+        collision_times.append(perf_counter() - start)
+
+    ai_game._check_bullet_alien_collisions = timed_check_collisions
+
+    # The first frame draws the whole screen; later frames only draw
+    #   what changed.
+    for _ in range(warmup_ticks):
+        play_tick(ai_game)
+    ai_game._update_screen()
+    collision_times.clear()
+
+    tick_times, frame_times, bullet_counts = [], [], []
+    for tick in range(ticks):
+        start = perf_counter()
+        play_tick(ai_game)
+        tick_times.append(perf_counter() - start)
+        bullet_counts.append(len(ai_game.bullets))
+
+        if tick % ticks_per_frame == 0:
+            start = perf_counter()
+            ai_game._update_screen()
+            frame_times.append(perf_counter() - start)
+
+    results = {
+        'scale': scale,
+        'playfield': [settings.screen_width, settings.screen_height],
+        'fleet_size': fleet_size,
+        'aliens_left': len(ai_game.aliens),
+        'mean_bullets': sum(bullet_counts) / len(bullet_counts),
+        'max_bullets': max(bullet_counts),
+        'ticks_per_second': len(tick_times) / sum(tick_times),
+    }
+    for name, timings in (('tick', tick_times),
+            ('collisions', collision_times), ('frame', frame_times)):
+        for percent in (50, 99):
+            results[f"{name}_p{percent}_ms"] = get_percentile(timings,
+                    percent) * 1000
+    return results
+
+
+def show_report(results):
+    """Print one line for each scale, from smallest to largest."""
+    print(f"{'scale':>5} {'aliens':>7} {'bullets':>7} {'tick p50':>9} "
+            f"{'p99':>7} {'collide':>8} {'frame p50':>10} {'p99':>7}")
+    for result in results:
+        print(f"{result['scale']:>5} {result['fleet_size']:>7,} "
+                f"{result['mean_bullets']:>7.0f} "
+                f"{result['tick_p50_ms']:>9.3f} {result['tick_p99_ms']:>7.3f} "
+                f"{result['collisions_p50_ms']:>8.3f} "
+                f"{result['frame_p50_ms']:>10.3f} "
+                f"{result['frame_p99_ms']:>7.3f}")
+    print("Times are in milliseconds; bullets is the mean number in the air.")
+
+
+def parse_args():
+    """Read the stress test settings from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 2, 4, 6],
+            help="how many times wider and taller each playfield is")
+    parser.add_argument('--bullets', type=int, default=500,
+            help="number of bullets allowed in the air at once")
+    parser.add_argument('--ticks', type=int, default=1200,
+            help="number of ticks to time at each scale")
+    parser.add_argument('--warmup-ticks', type=int, default=600,
+            help="number of ticks to play before timing")
+    parser.add_argument('--seed', type=int, default=0,
+            help="seed for every game")
+    parser.add_argument('--output', default=None,
+            help="JSON file to save the results in")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    # The game loads its images and sounds relative to its own directory.
+    output = Path(args.output).resolve() if args.output else None
+    os.chdir(Path(__file__).parent)
+
+    results = [run_stress_test(scale, args.bullets, args.ticks,
+            args.warmup_ticks, args.seed) for scale in args.scales]
+    show_report(results)
+    if output:
+        output.write_text(json.dumps(results, indent=2))
+        print(f"Wrote the results to {output}.")
@@ -0,0 +1,168 @@
+"""Tests for the simulation's fleet grid, replays, snapshots, and drawing.
+
+Each test plays a short game with an AI player and a fixed seed, so it
+  plays out the same way on every run.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+# The games in these tests never open a window or play a sound.
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import pygame
+
+from ai_player import AIPlayer
+from alien_invasion import AlienInvasion
+from replay import Replay
+
+
+def start_game(seed, strategy='targets_alien'):
+    """Start a headless game with an AI player, without playing a tick."""
+    ai_game = AlienInvasion(headless=True, seed=seed)
+    ai_player = AIPlayer(ai_game, strategy)
+
+    # With no ticks to play, run_game() only gets the game ready.
+    ai_player.run_game(max_ticks=0)
+    return ai_game, ai_player
+
+
+def get_state(ai_game):
+    """Return where everything is in ai_game, for comparing two games."""
+    stats = ai_game.stats
+    return (stats.ticks, stats.score, stats.level, stats.ships_left,
+            ai_game.ship.x, ai_game.fleet_grid.x,
+            ai_game.fleet_grid.get_offset(),
+            sorted(alien.rect.topleft for alien in ai_game.aliens),
+            [(bullet.rect.x, bullet.y) for bullet in ai_game.bullets])
+
+
+def play_on(ai_game, ticks):
+    """Play ticks more ticks with a new AI player, and return each state."""
+    ai_player = AIPlayer(ai_game)
+    states = []
+    for _ in range(ticks):
+        ai_player._play_tick()
+        states.append(get_state(ai_game))
+    return states
+
+
+class SimulationTestCase(unittest.TestCase):
+    """Tests for the parts of the game that AI players rely on."""
+
+    def setUp(self):
+        """Run from the game's folder, so it can find its images."""
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(Path(__file__).parent)
+
+    def test_grid_collisions(self):
+        """Does the fleet grid find the same collisions as pygame?"""
+        ai_game, ai_player = start_game(seed=4)
+        rng = random.Random(4)
+        hits = 0
+
+        for _ in range(2000):
+            ai_player._play_tick()
+            fleet_grid = ai_game.fleet_grid
+            aliens = ai_game.aliens
+
+            expected = pygame.sprite.groupcollide(ai_game.bullets, aliens,
+                    False, False)
+            found = {bullet: fleet_grid.collide(bullet.rect)
+                    for bullet in ai_game.bullets}
+            self.assertEqual(
+                    {bullet: set(hit) for bullet, hit in found.items() if hit},
+                    {bullet: set(hit) for bullet, hit in expected.items()})
+            hits += len(expected)
+
+            self.assertEqual(
+                    fleet_grid.collide_any(ai_game.ship.rect) is None,
+                    pygame.sprite.spritecollideany(ai_game.ship, aliens)
+                        is None)
+
+            # Rects anywhere on the screen should match as well, including
+            #   ones that only just touch an alien.
+            for _ in range(5):
+                rect = pygame.Rect(
+                        rng.randrange(ai_game.settings.screen_width),
+                        rng.randrange(ai_game.settings.screen_height),
+                        rng.randrange(1, 80), rng.randrange(1, 80))
+                self.assertEqual(set(fleet_grid.collide(rect)),
+                        {alien for alien in aliens
+                            if alien.rect.colliderect(rect)})
+
+        # The test only means something if bullets actually hit aliens.
+        self.assertGreater(hits, 0)
+
+    def test_replay_playback(self):
+        """Does playing a saved replay end in exactly the same state?"""
+        ai_game, ai_player = start_game(seed=7)
+        ai_player._run_headless(max_ticks=3000)
+
+        with tempfile.TemporaryDirectory() as replay_dir:
+            filename = Path(replay_dir) / 'game.replay'
+            ai_game.replay.save(filename)
+            replay = Replay.load(filename)
+
+        replay_game = AlienInvasion(headless=True, seed=replay.seed,
+                settings=replay.make_settings())
+        replay.play(replay_game)
+        self.assertEqual(get_state(replay_game), get_state(ai_game))
+        self.assertEqual(replay_game.replay.inputs, ai_game.replay.inputs)
+
+    def test_snapshot_restore(self):
+        """Does a restored game carry on exactly as the original did?"""
+        ai_game, ai_player = start_game(seed=7)
+        ai_player._run_headless(max_ticks=2000)
+        snapshot = ai_game.snapshot()
+        expected = play_on(ai_game, 1500)
+
+        # Go back in the same game, and restore into a new one.
+        ai_game.restore(snapshot)
+        self.assertEqual(play_on(ai_game, 1500), expected)
+
+        other_game = AlienInvasion(headless=True, seed=99)
+        other_game.restore(snapshot)
+        self.assertEqual(play_on(other_game, 1500), expected)
+
+        # The restored game's replay starts from the snapshot.
+        replay_game = AlienInvasion(headless=True)
+        other_game.replay.play(replay_game)
+        self.assertEqual(get_state(replay_game), expected[-1])
+
+    def test_fleet_drawing(self):
+        """Does drawing the fleet's surfaces match drawing each alien?"""
+        ai_game, ai_player = start_game(seed=7)
+        settings = ai_game.settings
+        screen = ai_game.screen
+
+        for tick in range(3000):
+            ai_player._play_tick()
+            if tick % 30:
+                continue
+
+            # The fleet keeps its formation.
+            fleet_grid = ai_game.fleet_grid
+            offset_x, offset_y = fleet_grid.get_offset()
+            for alien, (home_x, home_y) in fleet_grid.homes.items():
+                self.assertEqual(alien.rect.topleft,
+                        (home_x + offset_x, home_y + offset_y))
+
+            drawings = []
+            for fleet_surface_rendering in (True, False):
+                settings.fleet_surface_rendering = fleet_surface_rendering
+                screen.fill(settings.bg_color)
+                ai_game._draw_fleet()
+                drawings.append(pygame.image.tobytes(screen, 'RGB'))
+            self.assertEqual(drawings[0], drawings[1])
+
+        # The run should have shot down aliens, and cleared a fleet.
+        self.assertGreater(ai_game.stats.level, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
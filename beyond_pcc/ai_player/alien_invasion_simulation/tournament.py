@@ -0,0 +1,173 @@
+"""Play every AI strategy on the same seeded games, and rank the strategies.
+
+The strategies from each version of the AI player are collected in
+  AIPlayer.strategies, each with the speed and order it played in. The
+  game itself has no randomness; a game's seed only reaches the random
+  number generator the strategy uses. So a strategy that never uses
+  random numbers, like sweeps_right_left or modifies_speed, plays the
+  same game every time. Its results are reported as deterministic,
+  without a confidence interval.
+
+Each strategy plays the same games, so two strategies can be compared
+  game by game. The report shows the spread of each strategy's scores
+  and levels, a 95% confidence interval for each mean, and how many
+  games each strategy plays per second on one core. Strategies are
+  ranked by mean score, and each one is compared with the one ranked
+  below it.
+
+Example:
+    python tournament.py --games 200 --output tournament.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+from statistics import NormalDist, mean, median, quantiles, stdev
+from time import perf_counter
+
+from ai_player import AIPlayer
+from batch_runner import run_batch
+
+
+# Confidence intervals are 95% intervals, using the normal approximation.
+CONFIDENCE = 0.95
+Z_SCORE = NormalDist().inv_cdf((1 + CONFIDENCE) / 2)
+
+
+def get_interval(values):
+    """Return the mean of values, and the half width of its interval."""
+    if len(values) < 2:
+        return mean(values), float('nan')
+    return mean(values), Z_SCORE * stdev(values) / len(values) ** 0.5
+
+
+def describe(values):
+    """Return summary statistics for a list of numbers.
+
+    If every value is the same, there's no interval to give, so ci_low
+      and ci_high are None.
+    """
+    values_mean, half_width = get_interval(values)
+    deterministic = len(set(values)) == 1
+    if len(values) > 1:
+        p10, *_, p90 = quantiles(values, n=10)
+    else:
+        p10 = p90 = values[0]
+    return {
+        'mean': values_mean,
+        'deterministic': deterministic,
+        'ci_low': None if deterministic else values_mean - half_width,
+        'ci_high': None if deterministic else values_mean + half_width,
+        'median': median(values),
+        'p10': p10,
+        'p90': p90,
+        'min': min(values),
+        'max': max(values),
+    }
+
+
+def summarize(results, strategies):
+    """Return a summary of each strategy's results, best strategy first."""
+    summaries = []
+    for strategy in strategies:
+        games = sorted((r for r in results if r['strategy'] == strategy),
+                key=lambda r: r['seed'])
+        summaries.append({
+            'strategy': strategy,
+            'games': len(games),
+            'score': describe([r['score'] for r in games]),
+            'level': describe([r['level'] for r in games]),
+            'games_per_second': len(games) / sum(r['seconds'] for r in games),
+            'scores': [r['score'] for r in games],
+        })
+    summaries.sort(key=lambda s: s['score']['mean'], reverse=True)
+
+    # Compare each strategy with the next one down, game by game. The
+    #   difference is significant if its interval doesn't include zero.
+    #   If the difference is the same in every game, as it is between
+    #   two deterministic strategies, there's no interval to test.
+    for summary, next_summary in zip(summaries, summaries[1:]):
+        differences = [score - next_score for score, next_score
+                in zip(summary['scores'], next_summary['scores'])]
+        lead = describe(differences)
+        difference, half_width = get_interval(differences)
+        summary['lead'] = {
+            'over': next_summary['strategy'],
+            'mean': difference,
+            'deterministic': lead['deterministic'],
+            'ci_low': lead['ci_low'],
+            'ci_high': lead['ci_high'],
+            'significant': (not lead['deterministic']
+                and difference - half_width > 0),
+        }
+
+    for summary in summaries:
+        del summary['scores']
+    return summaries
+
+
+def show_report(summaries, games_per_second):
+    """Print a ranked table of the strategies."""
+    print(f"{'rank':<5}{'strategy':<22}{'mean score (95% CI)':>52}"
+            f"{'median':>18}{'p10':>18}{'p90':>18}"
+            f"{'mean level':>12}{'games/s':>9}")
+    for rank, summary in enumerate(summaries, 1):
+        score, level = summary['score'], summary['level']
+        if score['deterministic']:
+            interval = f"{score['mean']:,.0f} (deterministic)"
+        else:
+            interval = (f"{score['mean']:,.0f} "
+                    f"({score['ci_low']:,.0f} to {score['ci_high']:,.0f})")
+        print(f"{rank:<5}{summary['strategy']:<22}{interval:>52}"
+                f"{score['median']:>18,.0f}{score['p10']:>18,.0f}"
+                f"{score['p90']:>18,.0f}{level['mean']:>12.1f}"
+                f"{summary['games_per_second']:>9.1f}")
+
+    print()
+    for summary in summaries[:-1]:
+        lead = summary['lead']
+        if lead['deterministic']:
+            print(f"{summary['strategy']} beats {lead['over']} by "
+                    f"{lead['mean']:,.0f} points in every game.")
+            continue
+
+        verdict = "significant" if lead['significant'] else "not significant"
+        print(f"{summary['strategy']} beats {lead['over']} by "
+                f"{lead['mean']:,.0f} points a game "
+                f"({lead['ci_low']:,.0f} to {lead['ci_high']:,.0f}), "
+                f"{verdict}.")
+
+    print(f"\nPlayed {games_per_second:.1f} games a second overall.")
+
+
+def parse_args():
+    """Read the tournament settings from the command line."""
+    strategy_names = list(AIPlayer.strategies)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--strategies', nargs='+', choices=strategy_names,
+            default=strategy_names, help="strategies to enter")
+    parser.add_argument('--games', type=int, default=100,
+            help="number of games each strategy plays")
+    parser.add_argument('--first-seed', type=int, default=0,
+            help="seed of the first game")
+    parser.add_argument('--max-ticks', type=int, default=None,
+            help="stop any game that runs longer than this")
+    parser.add_argument('--processes', type=int, default=None,
+            help="number of worker processes (default: one per core)")
+    parser.add_argument('--output', default=None,
+            help="JSON file to save the summaries in")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    start_time = perf_counter()
+    results = run_batch(args.strategies, args.games, args.first_seed,
+            args.max_ticks, args.processes)
+    games_per_second = len(results) / (perf_counter() - start_time)
+
+    summaries = summarize(results, args.strategies)
+    show_report(summaries, games_per_second)
+    if args.output:
+        Path(args.output).write_text(json.dumps(summaries, indent=2))
+        print(f"Wrote the summaries to {args.output}.")
@@ -0,0 +1,55 @@
+"""A process-wide cache of images, so each image file is loaded only once.
+
+Every object that loads the same file gets the same Surface, so the
+  images handed out by the cache should be drawn, but never drawn on.
+"""
+
+import pygame
+
+
+class ImageCache:
+    """Load images from disk once, and share them after that."""
+
+    def __init__(self):
+        """Start with an empty cache."""
+        self.images = {}
+
+        # Track how often the cache saves a trip to the disk.
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, filename, alpha=False):
+        """Return the image in filename, loading it if needed.
+
+        Once the display has been created, the image is converted to the
+          display's pixel format when it's loaded, so it never needs to be
+          converted again when it's drawn. Set alpha to keep the image's
+          per-pixel transparency.
+        """
+        key = (filename, alpha)
+        if key in self.images:
+            self.hits += 1
+            return self.images[key]
+
+        self.misses += 1
+        image = pygame.image.load(filename)
+        if pygame.display.get_surface():
+            image = image.convert_alpha() if alpha else image.convert()
+
+        self.images[key] = image
+        return image
+
+    def clear(self):
+        """Forget all loaded images, and reset the hit and miss counts."""
+        self.images.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        """Return a summary of how well the cache is working."""
+        return (f"{len(self.images)} images cached, "
+                f"{self.hits} hits, {self.misses} misses")
+
+
+# The single cache shared by the whole program.
+image_cache = ImageCache()
@@ -12,13 +12,15 @@
 
 import pygame
 
+from utils.image_cache import image_cache
+
 
 class SpriteSheet:
 
     def __init__(self, filename):
         """Load the sheet."""
         try:
-            self.sheet = pygame.image.load(filename).convert()
+            self.sheet = image_cache.load(filename)
         except pygame.error as e:
             print(f"Unable to load spritesheet image: {filename}")
             raise SystemExit(e)
@@ -4,9 +4,10 @@ The :module:`alien` will handle the behaviors and characteristics of the alien N
 
 This will be done through the :class:`Alien`, which extends :class:`pygame.sprite.Sprite`.
 """
-import pygame
 from pygame.sprite import Sprite
 
+from my_images import load_image
+
 
 class Alien(Sprite):
     """
@@ -26,7 +27,7 @@ class Alien(Sprite):
         self.screen = alien_invasion.screen
         self._settings = alien_invasion.settings
         self._alien_image_file_path = 'images/alien_resized.png'
-        self._alien_image = pygame.image.load(self.alien_image_file_path)
+        self._alien_image = load_image(self.alien_image_file_path)
         self.alien_rectangle = self.alien_image.get_rect()
         """
         pygame.Rect: The hit box for the alien NPC sprites.
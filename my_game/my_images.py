@@ -0,0 +1,43 @@
+﻿# coding=utf-8
+"""
+The :module:`my_images` module loads the images for my sprites.
+
+Each image is loaded from disk only once, and converted to the display's pixel format as soon as it's loaded, so
+drawing it never needs a per-pixel conversion.
+"""
+import pygame
+
+_loaded_images = {}
+"""
+dict: The images that have already been loaded, keyed by file path.
+"""
+
+
+def load_image(image_file_path):
+    """
+    Load an image and convert it to the display's pixel format.
+
+    The images for my sprites are PNGs with transparent backgrounds, so the image keeps its per-pixel alpha. It's also
+    run-length encoded, so the transparent pixels are skipped quickly when it's drawn. Every sprite that loads the same
+    file shares the same image, so it should never be drawn on.
+
+    Parameters
+    ----------
+    image_file_path : str
+        The file path to the image.
+
+    Returns
+    -------
+    pygame.Surface
+        The converted image.
+
+    Raises
+    ------
+    pygame.error
+        If the display hasn't been created yet.
+    """
+    if image_file_path not in _loaded_images:
+        image = pygame.image.load(image_file_path).convert_alpha()
+        image.set_alpha(255, pygame.RLEACCEL)
+        _loaded_images[image_file_path] = image
+    return _loaded_images[image_file_path]
@@ -2,7 +2,7 @@
 """
 The :module:`my_ship` module will manage my ship and its controls.
 """
-import pygame
+from my_images import load_image
 
 
 class Ship:
@@ -32,7 +32,7 @@ class Ship:
         pygame.Rect: The rectangle for the game window.
         """
         self._ship_image_file_path = 'images/ship_resized.png'
-        self.ship_image = pygame.image.load(self.ship_image_file_path)
+        self.ship_image = load_image(self.ship_image_file_path)
         """
         pygame.Surface: The ship_image of the player's ship.
         """